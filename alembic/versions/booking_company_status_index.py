@@ -0,0 +1,28 @@
+"""Add composite (company_id, status, start_time) index on bookings
+
+Revision ID: 2026_booking_company_status
+Revises: 2026_user_role_index
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2026_booking_company_status'
+down_revision = '2026_user_role_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_booking_company_status_start',
+        'bookings',
+        ['company_id', 'status', 'start_time'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_booking_company_status_start', table_name='bookings')
@@ -0,0 +1,86 @@
+"""Add services.booking_count counter and booking service index
+
+Revision ID: 2026_service_booking_count
+Revises: 2023_initial_tables
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2026_service_booking_count'
+down_revision = '2023_initial_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Индекс для соединения бронирований с услугами
+    op.create_index('ix_booking_service', 'bookings', ['service_id'], unique=False)
+
+    # Счетчик бронирований услуги
+    op.add_column(
+        'services',
+        sa.Column('booking_count', sa.Integer(), nullable=False, server_default=sa.text('0'))
+    )
+
+    # Заполняем счетчик по уже существующим бронированиям
+    op.execute("""
+        UPDATE services SET booking_count = counts.cnt
+        FROM (
+            SELECT service_id, COUNT(id) AS cnt
+            FROM bookings
+            WHERE service_id IS NOT NULL
+            GROUP BY service_id
+        ) AS counts
+        WHERE services.id = counts.service_id
+    """)
+
+    op.create_index(
+        'ix_service_company_booking_count', 'services', ['company_id', 'booking_count'], unique=False
+    )
+
+    # Счетчик поддерживается триггерами на bookings, поэтому учитываются все пути
+    # изменения бронирований: ORM, каскады, массовые DELETE и прямой SQL
+    op.execute("""
+        CREATE OR REPLACE FUNCTION services_booking_count_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.service_id IS NOT NULL THEN
+                UPDATE services SET booking_count = booking_count - 1 WHERE id = OLD.service_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.service_id IS NOT NULL THEN
+                UPDATE services SET booking_count = booking_count + 1 WHERE id = NEW.service_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER bookings_booking_count_insert
+        AFTER INSERT ON bookings
+        FOR EACH ROW EXECUTE FUNCTION services_booking_count_sync()
+    """)
+    op.execute("""
+        CREATE TRIGGER bookings_booking_count_delete
+        AFTER DELETE ON bookings
+        FOR EACH ROW EXECUTE FUNCTION services_booking_count_sync()
+    """)
+    # Перенос бронирования на другую услугу тоже меняет оба счетчика
+    op.execute("""
+        CREATE TRIGGER bookings_booking_count_update
+        AFTER UPDATE OF service_id ON bookings
+        FOR EACH ROW WHEN (OLD.service_id IS DISTINCT FROM NEW.service_id)
+        EXECUTE FUNCTION services_booking_count_sync()
+    """)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS bookings_booking_count_update ON bookings")
+    op.execute("DROP TRIGGER IF EXISTS bookings_booking_count_delete ON bookings")
+    op.execute("DROP TRIGGER IF EXISTS bookings_booking_count_insert ON bookings")
+    op.execute("DROP FUNCTION IF EXISTS services_booking_count_sync()")
+    op.drop_index('ix_service_company_booking_count', table_name='services')
+    op.drop_column('services', 'booking_count')
+    op.drop_index('ix_booking_service', table_name='bookings')
@@ -0,0 +1,33 @@
+"""Add trigram indexes for service search
+
+Revision ID: 2026_service_search_trgm
+Revises: 2026_service_booking_count
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2026_service_search_trgm'
+down_revision = '2026_service_booking_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Триграммные GIN-индексы позволяют использовать индекс для ILIKE '%term%'
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_service_name_trgm', 'services', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_service_desc_trgm', 'services', ['description'], unique=False,
+        postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}
+    )
+
+
+def downgrade():
+    op.drop_index('ix_service_desc_trgm', table_name='services')
+    op.drop_index('ix_service_name_trgm', table_name='services')
@@ -0,0 +1,26 @@
+"""Drop single-column schedule_id index on time_slots covered by the composite index
+
+Revision ID: 2026_time_slot_schedule_start
+Revises: 2026_time_slot_unique_times
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2026_time_slot_schedule_start'
+down_revision = '2026_time_slot_unique_times'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ix_timeslot_schedule_start_end начинается с schedule_id и обслуживает те же запросы
+    op.drop_index('ix_time_slots_schedule_id', table_name='time_slots')
+    # Обновляем статистику, чтобы планировщик сразу выбирал составной индекс
+    op.execute('ANALYZE time_slots')
+
+
+def downgrade():
+    op.create_index('ix_time_slots_schedule_id', 'time_slots', ['schedule_id'], unique=False)
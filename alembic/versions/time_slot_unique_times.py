@@ -0,0 +1,67 @@
+"""Add unique (schedule_id, start_time, end_time) index on time_slots
+
+Revision ID: 2026_time_slot_unique_times
+Revises: 2026_booking_company_status
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2026_time_slot_unique_times'
+down_revision = '2026_booking_company_status'
+branch_labels = None
+depends_on = None
+
+
+# Для каждой группы одинаковых слотов оставляется слот с наименьшим id
+DUPLICATE_SLOTS = """
+    SELECT id, min(id) OVER (PARTITION BY schedule_id, start_time, end_time) AS keep_id
+    FROM time_slots
+"""
+
+
+def upgrade():
+    # Бронирования дублей переносятся на оставляемый слот, затем дубли удаляются
+    op.execute(f"""
+        UPDATE bookings SET time_slot_id = d.keep_id
+        FROM ({DUPLICATE_SLOTS}) AS d
+        WHERE bookings.time_slot_id = d.id AND d.id <> d.keep_id
+    """)
+    # Счетчик и статус оставляемых слотов пересчитываются по перенесенным бронированиям
+    op.execute(f"""
+        UPDATE time_slots SET
+            booked_clients = c.cnt,
+            status = CASE
+                WHEN time_slots.is_blocked THEN 'blocked'
+                WHEN c.cnt >= time_slots.max_clients THEN 'booked'
+                WHEN c.cnt > 0 THEN 'partially_booked'
+                ELSE 'available'
+            END
+        FROM (
+            SELECT k.keep_id, count(b.id) AS cnt
+            FROM (
+                SELECT DISTINCT keep_id FROM ({DUPLICATE_SLOTS}) AS d
+                WHERE d.id <> d.keep_id
+            ) AS k
+            LEFT JOIN bookings b ON b.time_slot_id = k.keep_id
+            GROUP BY k.keep_id
+        ) AS c
+        WHERE time_slots.id = c.keep_id
+    """)
+    op.execute(f"""
+        DELETE FROM time_slots
+        USING ({DUPLICATE_SLOTS}) AS d
+        WHERE time_slots.id = d.id AND d.id <> d.keep_id
+    """)
+    op.create_index(
+        'ix_timeslot_schedule_start_end',
+        'time_slots',
+        ['schedule_id', 'start_time', 'end_time'],
+        unique=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_timeslot_schedule_start_end', table_name='time_slots')
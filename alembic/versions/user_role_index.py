@@ -0,0 +1,24 @@
+"""Add composite (role, id) index on users
+
+Revision ID: 2026_user_role_index
+Revises: 2026_service_search_trgm
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2026_user_role_index'
+down_revision = '2026_service_search_trgm'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Индексы ix_users_email и ix_users_phone уже созданы начальными миграциями
+    op.create_index('ix_user_role_id', 'users', ['role', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_user_role_id', table_name='users')
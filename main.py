@@ -27,6 +27,8 @@ if __name__ == "__main__":
         "src.app:app",
         host=host,
         port=port,
+        # auto выбирает uvloop, если он установлен (Linux/macOS), иначе стандартный asyncio
+        loop="auto",
         reload=True
     )
     logger.info("Приложение остановлено") 
\ No newline at end of file
@@ -71,6 +71,48 @@ def run_migrations():
         except Exception as e:
             logger.error(f"Ошибка при применении initial_tables: {e}")
             
+        try:
+            # Применяем service_booking_count
+            logger.info("Применяем service_booking_count...")
+            command.upgrade(alembic_cfg, "2026_service_booking_count")
+        except Exception as e:
+            logger.error(f"Ошибка при применении service_booking_count: {e}")
+            
+        try:
+            # Применяем service_search_trgm
+            logger.info("Применяем service_search_trgm...")
+            command.upgrade(alembic_cfg, "2026_service_search_trgm")
+        except Exception as e:
+            logger.error(f"Ошибка при применении service_search_trgm: {e}")
+            
+        try:
+            # Применяем user_role_index
+            logger.info("Применяем user_role_index...")
+            command.upgrade(alembic_cfg, "2026_user_role_index")
+        except Exception as e:
+            logger.error(f"Ошибка при применении user_role_index: {e}")
+            
+        try:
+            # Применяем booking_company_status_index
+            logger.info("Применяем booking_company_status_index...")
+            command.upgrade(alembic_cfg, "2026_booking_company_status")
+        except Exception as e:
+            logger.error(f"Ошибка при применении booking_company_status_index: {e}")
+            
+        try:
+            # Применяем time_slot_unique_times
+            logger.info("Применяем time_slot_unique_times...")
+            command.upgrade(alembic_cfg, "2026_time_slot_unique_times")
+        except Exception as e:
+            logger.error(f"Ошибка при применении time_slot_unique_times: {e}")
+            
+        try:
+            # Применяем time_slot_schedule_start_index
+            logger.info("Применяем time_slot_schedule_start_index...")
+            command.upgrade(alembic_cfg, "2026_time_slot_schedule_start")
+        except Exception as e:
+            logger.error(f"Ошибка при применении time_slot_schedule_start_index: {e}")
+            
         # Проверяем, что наиболее важные таблицы созданы
         from sqlalchemy import create_engine, text, inspect
         engine = create_engine(DATABASE_URL)
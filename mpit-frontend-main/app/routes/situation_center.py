@@ -6,6 +6,7 @@ import os
 import time
 import random
 from pathlib import Path as PathLib
+from urllib.parse import urlencode
 
 # Настройка шаблонов
 templates_dir = PathLib(__file__).resolve().parent.parent / "templates"
@@ -13,8 +14,8 @@ templates = Jinja2Templates(directory=str(templates_dir))
 def https_url_for(name: str, **path_params: Any) -> str:
     url = os.getenv("MAIN_PATH") + name
     if path_params:
-        params = [f"{name}={value}" for name, value in path_params.items()]
-        url += "?" + "&".join(params)
+        # urlencode экранирует значения, поэтому &, = и пробелы не ломают строку запроса
+        url += "?" + urlencode(path_params, doseq=True)
     return url
 
 templates.env.globals["https_url_for"] = https_url_for
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.adapters.database.models.user import User
 from src.adapters.database.repositories.base import BaseRepository
 from src.utils.exceptions import UserAlreadyExists, InvalidCredentials
-from src.utils.security import verify_password
+from src.utils.security import averify_password
 
 
 class UserRepository(BaseRepository[User]):
@@ -34,7 +34,7 @@ class UserRepository(BaseRepository[User]):
         if not user:
             raise InvalidCredentials("User not found")
         
-        if not verify_password(password, user.password_hash):
+        if not await averify_password(password, user.password_hash):
             raise InvalidCredentials("Invalid password")
         
         # Обновляем время последнего входа
@@ -7,7 +7,8 @@ import logging
 
 from src.db.database import get_db
 from src.core.config import settings
-from src.core.security import create_access_token, verify_password
+from src.core.security import create_access_token
+from src.utils.security import averify_password
 from src.core.errors import UnauthorizedError, ForbiddenError
 from src.repositories.user import UserRepository
 from src.schemas.user import Token, TokenData, UserResponse
@@ -315,7 +316,7 @@ async def login_for_access_token(
         raise UnauthorizedError("Неверный email или пароль")
     
     # Проверяем пароль
-    if not verify_password(form_data.password, user.hashed_password):
+    if not await averify_password(form_data.password, user.hashed_password):
         raise UnauthorizedError("Неверный email или пароль")
     
     # Создаем токен доступа
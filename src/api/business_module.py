@@ -87,13 +87,10 @@ async def company_dashboard(
     
     # Проверяем права доступа
     if company and (company.owner_id == current_user.id or current_user.role == "admin"):
-        # Получаем количество активных бронирований
-        booking_repo = BookingRepository(db)
-        active_bookings_count = await booking_repo.count_active_by_company(company_id)
-        
-        # Получаем количество услуг
-        service_repo = ServiceRepository(db)
-        services_count = await service_repo.count_by_company(company_id)
+        # Количество активных бронирований и услуг получаем за один запрос
+        active_bookings_count, services_count = await BookingRepository.get_dashboard_counts(
+            db, company_id
+        )
         
         templates = get_templates(request)
         
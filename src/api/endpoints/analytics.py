@@ -37,7 +37,6 @@ async def get_company_stats(
         Статистика по компании
     """
     company_repo = CompanyRepository(db)
-    booking_repo = BookingRepository(db)
     
     # Проверяем существование компании
     company = await company_repo.get_by_id(company_id)
@@ -64,7 +63,8 @@ async def get_company_stats(
         end_date = datetime.now()
     
     # Получаем статистику бронирований
-    booking_stats = await booking_repo.get_company_booking_stats(
+    booking_stats = await BookingRepository.get_company_booking_stats(
+        db,
         company_id=company_id,
         start_date=start_date,
         end_date=end_date
@@ -18,7 +18,7 @@ from src.schemas.user import (
     LoginRequest,
     PasswordChange
 )
-from src.utils.security import verify_password, get_password_hash
+from src.utils.security import averify_password, ahash_password
 from src.core.config import settings
 
 # Настройка логгера
@@ -85,7 +85,7 @@ async def register_user(
         
         # Создаем пользователя
         user_dict = user.dict(exclude={"password_confirm", "is_active", "is_superuser"})
-        user_dict["hashed_password"] = get_password_hash(user_dict["password"])
+        user_dict["hashed_password"] = await ahash_password(user_dict["password"])
         user_dict.pop("password", None)
         
         # Обеспечиваем безопасность: обычные пользователи не могут регистрироваться как администраторы
@@ -153,7 +153,7 @@ async def login_for_access_token(
                 headers={"WWW-Authenticate": "Bearer"},
             )
             
-        if not verify_password(form_data.password, user.hashed_password):
+        if not await averify_password(form_data.password, user.hashed_password):
             logger.warning(f"Неверный пароль для пользователя: {form_data.username}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -2,7 +2,7 @@
 Эндпоинты для системы уведомлений
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db_adapter import get_db
@@ -11,7 +11,8 @@ from src.repositories.notification import NotificationRepository
 from src.schemas.notification import (
     NotificationCreate,
     NotificationResponse,
-    NotificationUpdate
+    NotificationUpdate,
+    NOTIFICATION_LIST_ADAPTER
 )
 
 router = APIRouter(tags=["Уведомления"])
@@ -39,12 +40,20 @@ async def get_notifications(
         Список уведомлений
     """
     notification_repo = NotificationRepository(db)
-    return await notification_repo.get_by_user(
+    notifications = await notification_repo.get_by_user(
         user_id=current_user.id,
         read=read,
         limit=limit,
         offset=offset
     )
+    
+    # Весь список проверяется и сериализуется в JSON одним вызовом pydantic-core
+    return Response(
+        content=NOTIFICATION_LIST_ADAPTER.dump_json(
+            NOTIFICATION_LIST_ADAPTER.validate_python(notifications, from_attributes=True)
+        ),
+        media_type="application/json"
+    )
 
 
 @router.get("/count", response_model=int)
@@ -1,13 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, time
 
 from src.database import get_db
 from src.schemas.schedule import (
     ScheduleCreate, ScheduleUpdate, ScheduleResponse, 
     TimeSlotCreate, TimeSlotUpdate, TimeSlotResponse,
-    GenerateSlotsRequest, GenerateSlotsResponse
+    GenerateSlotsRequest, GenerateSlotsResponse, TIME_SLOT_LIST_ADAPTER
 )
 from src.services.schedule_service import ScheduleService
 from src.services.auth_service import get_current_user
@@ -60,7 +60,8 @@ async def list_schedules(
     await check_company_permission(db, current_user, company_id)
     
     schedule_service = ScheduleService(db)
-    schedules = await schedule_service.list_schedules(company_id, service_id)
+    # Ответ сериализуется из строк таблицы, ORM-объекты не нужны
+    schedules = await schedule_service.list_schedules(company_id, service_id, core=True)
     return schedules
 
 @router.put("/schedules/{schedule_id}", response_model=ScheduleResponse)
@@ -171,7 +172,7 @@ async def list_timeslots(
     
     if start_date:
         try:
-            start_datetime = datetime.strptime(start_date, '%Y-%m-%d')
+            start_datetime = datetime.combine(date.fromisoformat(start_date), time.min)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -180,20 +181,28 @@ async def list_timeslots(
     
     if end_date:
         try:
-            end_datetime = datetime.strptime(end_date, '%Y-%m-%d')
-            # Устанавливаем конец дня
-            end_datetime = end_datetime.replace(hour=23, minute=59, second=59)
+            # Граница диапазона не включается: начало следующего дня
+            end_datetime = datetime.combine(date.fromisoformat(end_date) + timedelta(days=1), time.min)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Неверный формат конечной даты. Ожидается YYYY-MM-DD"
             )
     
-    return await schedule_service.list_timeslots(
+    timeslots = await schedule_service.list_timeslots(
         schedule_id, 
         start_time=start_datetime, 
         end_time=end_datetime,
-        is_available=is_available
+        is_available=is_available,
+        core=True
+    )
+    
+    # Весь список проверяется и сериализуется в JSON одним вызовом pydantic-core
+    return Response(
+        content=TIME_SLOT_LIST_ADAPTER.dump_json(
+            TIME_SLOT_LIST_ADAPTER.validate_python(timeslots, from_attributes=True)
+        ),
+        media_type="application/json"
     )
 
 @router.put("/slots/{slot_id}", response_model=TimeSlotResponse)
@@ -258,14 +267,9 @@ async def generate_timeslots(
     
     await check_company_permission(db, current_user, schedule.company_id)
     
-    try:
-        start_date = datetime.strptime(request.start_date, '%Y-%m-%d')
-        end_date = datetime.strptime(request.end_date, '%Y-%m-%d')
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Неверный формат даты. Ожидается YYYY-MM-DD"
-        )
+    # Формат дат уже проверен схемой запроса
+    start_date = datetime.combine(request.start_date, time.min)
+    end_date = datetime.combine(request.end_date, time.min)
     
     if start_date > end_date:
         raise HTTPException(
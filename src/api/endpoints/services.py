@@ -2,7 +2,7 @@
 Эндпоинты для работы с услугами
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query, Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db_adapter import get_db
@@ -12,7 +12,8 @@ from src.repositories.company import CompanyRepository
 from src.schemas.service import (
     ServiceCreate, 
     ServiceUpdate, 
-    ServiceResponse
+    ServiceResponse,
+    SERVICE_LIST_ADAPTER
 )
 
 router = APIRouter(tags=["Услуги"])
@@ -78,12 +79,21 @@ async def list_services(
         Список услуг
     """
     service_repo = ServiceRepository(db)
-    return await service_repo.get_all(
+    services = await service_repo.get_all(
         company_id=company_id,
         category=category,
         limit=limit,
         offset=offset
     )
+    
+    # Весь список проверяется и сериализуется в JSON одним вызовом pydantic-core
+    # вместо повторной проверки каждого элемента в FastAPI
+    return Response(
+        content=SERVICE_LIST_ADAPTER.dump_json(
+            SERVICE_LIST_ADAPTER.validate_python(services, from_attributes=True)
+        ),
+        media_type="application/json"
+    )
 
 
 @router.get("/{service_id}", response_model=ServiceResponse)
@@ -1,9 +1,12 @@
 """
 Эндпоинты для работы с пользователями
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+
+import orjson
 
 from src.db_adapter import get_db
 from src.services.auth_service import get_current_user, get_current_admin_user
@@ -16,6 +19,7 @@ from src.schemas.user import (
     UserDetailResponse
 )
 from src.utils.security import get_password_hash
+from src.utils.dates import request_now
 
 router = APIRouter(prefix="/users", tags=["Пользователи"])
 
@@ -48,6 +52,7 @@ async def read_users_me(
 
 @router.put("/me", response_model=UserResponse)
 async def update_user_me(
+    request: Request,
     user_data: UserUpdate,
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -56,6 +61,7 @@ async def update_user_me(
     Обновить информацию о текущем пользователе
     
     Args:
+        request: Текущий запрос
         user_data: Новые данные пользователя
         current_user: Текущий пользователь
         db: Сессия базы данных
@@ -90,7 +96,7 @@ async def update_user_me(
             # Только админ может менять роли
             update_data.pop("role")
     
-    updated_user = await user_repo.update(current_user.id, update_data)
+    updated_user = await user_repo.update(current_user.id, update_data, now=request_now(request))
     return updated_user
 
 
@@ -118,6 +124,35 @@ async def get_users(
     return users
 
 
+@router.get("/export")
+async def export_users(
+    role: Optional[UserRole] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_admin_user)
+):
+    """
+    Выгрузить пользователей в формате NDJSON (только для админа)
+    
+    Пользователи читаются из базы порциями и сразу отправляются клиенту,
+    поэтому выгрузка не держит весь список в памяти.
+    
+    Args:
+        role: Фильтр по роли (необязательный)
+        db: Сессия базы данных
+        current_user: Текущий пользователь (администратор)
+        
+    Returns:
+        Потоковый ответ, по одному пользователю в строке
+    """
+    user_repo = UserRepository(db)
+    
+    async def generate():
+        async for user in user_repo.stream_by_role(role.value if role else None):
+            yield orjson.dumps(UserResponse.model_validate(user).model_dump(mode="json")) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/{user_id}", response_model=UserDetailResponse)
 async def get_user(
     user_id: int,
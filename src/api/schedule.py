@@ -214,7 +214,7 @@ def get_service_time_slots(
             raise HTTPException(status_code=400, detail="Неверный формат конечной даты")
     
     # Получаем временные слоты
-    time_slots = TimeSlotRepository.get_service_time_slots(
+    time_slots = TimeSlotRepository.iter_service_time_slots(
         db, service_id, start_datetime, end_datetime
     )
     
@@ -237,7 +237,7 @@ def get_available_time_slots(
         raise HTTPException(status_code=400, detail="Неверный формат даты")
     
     # Получаем доступные временные слоты
-    time_slots = TimeSlotRepository.get_available_time_slots(
+    time_slots = TimeSlotRepository.iter_available_time_slots(
         db, service_id, start_datetime, end_datetime
     )
     
@@ -1,12 +1,12 @@
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends, BackgroundTasks, Body, HTTPException, status
+from fastapi import APIRouter, Depends, BackgroundTasks, Body, HTTPException, Response, status
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.database import get_db
 from src.core.config import settings
-from src.services.telegram import TelegramService
+from src.services.telegram import TelegramService, get_telegram_service
 from src.api.auth import get_current_admin_user
 from src.schemas.user import UserResponse
 
@@ -29,50 +29,48 @@ async def verify_telegram_webhook(api_key: str = Depends(API_KEY_HEADER)):
 
 @router.post("/webhook", status_code=status.HTTP_200_OK)
 async def telegram_webhook(
+    background_tasks: BackgroundTasks,
     update: Dict[str, Any] = Body(...),
-    background_tasks: BackgroundTasks = None,
     db: AsyncSession = Depends(get_db),
+    telegram_service: TelegramService = Depends(get_telegram_service),
     _: None = Depends(verify_telegram_webhook)
 ):
     """
     Вебхук для обработки обновлений от Telegram
     
     Args:
-        update: Данные обновления от Telegram
         background_tasks: Фоновые задачи
+        update: Данные обновления от Telegram
         db: Сессия базы данных
+        telegram_service: Сервис Telegram
         _: Проверка API ключа
         
     Returns:
         Успешный ответ для Telegram
     """
-    # Создаем экземпляр сервиса Telegram
-    telegram_service = TelegramService()
-    
-    # Обрабатываем обновление в фоновом режиме
-    if background_tasks:
-        background_tasks.add_task(telegram_service.process_update, update)
-    else:
-        await telegram_service.process_update(update)
+    # Обновление обрабатывается после отправки ответа: Telegram получает 200 сразу,
+    # не дожидаясь исходящих запросов к Bot API внутри process_update
+    background_tasks.add_task(telegram_service.process_update, update)
     
     # Telegram ожидает пустой ответ со статусом 200
-    return {"ok": True}
+    return Response(status_code=status.HTTP_200_OK)
 
 
 @router.post("/setup", status_code=status.HTTP_200_OK)
 async def setup_telegram_webhook(
-    current_user: UserResponse = Depends(get_current_admin_user)
+    current_user: UserResponse = Depends(get_current_admin_user),
+    telegram_service: TelegramService = Depends(get_telegram_service)
 ):
     """
     Установить вебхук для Telegram бота
     
     Args:
         current_user: Текущий пользователь (должен быть администратором)
+        telegram_service: Сервис Telegram
         
     Returns:
         Результат установки вебхука
     """
-    telegram_service = TelegramService()
     result = await telegram_service.set_webhook()
     
     return {"ok": True, "result": result}
@@ -80,18 +78,19 @@ async def setup_telegram_webhook(
 
 @router.post("/remove", status_code=status.HTTP_200_OK)
 async def remove_telegram_webhook(
-    current_user: UserResponse = Depends(get_current_admin_user)
+    current_user: UserResponse = Depends(get_current_admin_user),
+    telegram_service: TelegramService = Depends(get_telegram_service)
 ):
     """
     Удалить вебхук для Telegram бота
     
     Args:
         current_user: Текущий пользователь (должен быть администратором)
+        telegram_service: Сервис Telegram
         
     Returns:
         Результат удаления вебхука
     """
-    telegram_service = TelegramService()
     result = await telegram_service.delete_webhook()
     
     return {"ok": True, "result": result} 
\ No newline at end of file
@@ -2,11 +2,10 @@ from fastapi import FastAPI, Depends, Request, HTTPException, status, Form, Path
 from sqlalchemy.orm import Session
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 import asyncio
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi.responses import RedirectResponse, HTMLResponse
+from fastapi.responses import RedirectResponse, HTMLResponse, ORJSONResponse
 from jose import jwt, JWTError
 from src.core.errors import UnauthorizedError
 import urllib.parse
@@ -27,13 +26,15 @@ from src.api.endpoints.moderation import router as moderation_router
 from src.api.form_config import router as form_config_router
 from src.api.business_module import router as business_module_router
 from src.core.jinja_filters import configure_jinja_filters
-from src.db_adapter import create_default_admin
+from src.templates import templates
+from src.db_adapter import create_default_admin, warm_up_pool, engine as adapter_engine
 from src.api.endpoints.auth import register_user, login_for_access_token, OAuth2PasswordRequestForm
 from src.schemas.user import UserCreate, UserResponse, Token, LoginRequest
 from src.repositories.user import UserRepository
 from src.models.user import UserRole
 from src.utils.security import get_password_hash, verify_password
 from src.services.auth_service import create_access_token, get_current_user
+from src.services.telegram import telegram_service
 
 # Настройка логгера
 logging.basicConfig(level=logging.INFO)
@@ -44,6 +45,8 @@ app = FastAPI(
     title="Сервис бронирования",
     description="API для сервиса бронирования услуг компаний",
     version="1.0.0",
+    # JSON-ответы сериализуются через orjson
+    default_response_class=ORJSONResponse,
 )
 
 # Создание таблиц происходит в скрипте миграций
@@ -66,8 +69,7 @@ app.mount("/img", StaticFiles(directory=f"{settings.STATIC_DIR}/img"), name="img
 app.mount("/images", StaticFiles(directory=f"{settings.STATIC_DIR}/images"), name="images")
 app.mount("/fonts", StaticFiles(directory=f"{settings.STATIC_DIR}/fonts"), name="fonts")
 
-# Настройка шаблонов Jinja2
-templates = Jinja2Templates(directory=settings.TEMPLATES_DIR)
+# Настройка шаблонов Jinja2 (общий экземпляр для всего приложения)
 app.state.templates = templates
 
 # Настройка Jinja2 фильтров
@@ -97,10 +99,25 @@ async def startup_event():
         # Просто создаем администратора по умолчанию, если его нет
         await create_default_admin()
         
+        # Прогреваем пулы соединений, чтобы первые запросы не ждали подключения к БД
+        await warm_up_pool()
+        if engine is not adapter_engine:
+            await warm_up_pool(engine)
+        
+        # Запускаем фоновую отправку уведомлений Telegram из общей очереди
+        telegram_service.start_notification_worker()
+        
         print("Приложение успешно запущено")
     except Exception as e:
         print(f"Ошибка при запуске приложения: {e}")
 
+# Событие остановки приложения
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Выполняется при остановке приложения"""
+    # Закрываем общий пул соединений к Telegram API
+    await telegram_service.aclose()
+
 @app.get("/")
 def read_root(request: Request):
     """
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import List, Optional
 
 from pydantic import HttpUrl, PostgresDsn, AnyHttpUrl, SecretStr
@@ -25,6 +26,9 @@ class Settings(BaseSettings):
     
     # Настройки базы данных
     DATABASE_URL: PostgresDsn
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # секунды
     
     # Настройки JWT
     JWT_SECRET_KEY: str
@@ -42,6 +46,9 @@ class Settings(BaseSettings):
     TELEGRAM_BOT_TOKEN: Optional[str] = None
     TELEGRAM_WEBHOOK_URL: Optional[HttpUrl] = None
     TELEGRAM_WEBHOOK_API_KEY: Optional[str] = None  # API ключ для защиты вебхука
+    # Число параллельных HTTPS-доставок обновлений на вебхук (1-100, по умолчанию Telegram - 40).
+    # Большее значение ускоряет обработку всплесков, но увеличивает одновременную нагрузку на воркеры
+    TELEGRAM_WEBHOOK_MAX_CONNECTIONS: int = 40
     
     # Настройки тестирования
     TESTING: bool = False
@@ -69,5 +76,17 @@ class Settings(BaseSettings):
     )
 
 
-# Создаем глобальный экземпляр настроек для импорта в других модулях
-settings = Settings() 
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Получить настройки приложения
+    
+    Настройки (включая разбор .env) создаются один раз за процесс;
+    функцию можно использовать как зависимость FastAPI.
+    """
+    return Settings()
+
+
+# Глобальный экземпляр настроек для импорта в других модулях
+settings = get_settings()
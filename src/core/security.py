@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Union, Optional
 
 from jose import jwt
@@ -31,9 +31,9 @@ def create_access_token(subject: Union[str, Any] = None, data: dict = None, expi
     
     # Добавляем время истечения
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_TOKEN_LIFETIME)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_TOKEN_LIFETIME)
     
     to_encode.update({"exp": expire})
     
@@ -36,7 +36,14 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     future=True,
     # В продакшене отключать пулинг не рекомендуется, это для примера
-    poolclass=NullPool if settings.TESTING else None
+    poolclass=NullPool if settings.TESTING else None,
+    # NullPool не поддерживает параметры пула
+    **({} if settings.TESTING else {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    })
 )
 
 # Создаем фабрику асинхронных сессий
@@ -23,13 +23,25 @@ Base = declarative_base(metadata=mapper_registry.metadata)
 DATABASE_URL = os.environ.get("DATABASE_URL", "postgresql+asyncpg://postgres:postgres@db:5432/qwertytown")
 DEBUG = os.environ.get("DEBUG", "false").lower() == "true"
 TESTING = os.environ.get("TESTING", "false").lower() == "true"
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+
+# Параметры пула соединений (NullPool в тестах их не поддерживает)
+pool_options = {} if TESTING else {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_pre_ping": True,
+    "pool_recycle": DB_POOL_RECYCLE,
+}
 
 # Создаем движок SQLAlchemy
 engine = create_async_engine(
     DATABASE_URL,
     echo=DEBUG,
     future=True,
-    poolclass=NullPool if TESTING else None
+    poolclass=NullPool if TESTING else None,
+    **pool_options
 )
 
 # Создаем фабрику сессий
@@ -72,6 +84,39 @@ async def check_db_connection() -> bool:
         return False
 
 
+async def warm_up_pool(db_engine=None, size: int = None) -> int:
+    """
+    Заранее открывает соединения пула, чтобы первые запросы после старта
+    не тратили время на установку соединения с БД
+    
+    Args:
+        db_engine: Движок для прогрева (по умолчанию engine этого модуля)
+        size: Количество соединений (по умолчанию размер пула)
+        
+    Returns:
+        Количество успешно открытых соединений
+    """
+    db_engine = db_engine or engine
+    if TESTING:
+        return 0
+    size = size or DB_POOL_SIZE
+    
+    # Соединения открываются параллельно, поэтому пул создает новые,
+    # а не переиспользует одно и то же
+    async def _open_connection() -> bool:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    
+    results = await asyncio.gather(
+        *(_open_connection() for _ in range(size)),
+        return_exceptions=True
+    )
+    opened = sum(1 for result in results if result is True)
+    logger.info(f"Пул соединений прогрет: {opened} из {size}")
+    return opened
+
+
 async def create_default_admin():
     """
     Создает администратора по умолчанию, если он не существует
@@ -80,7 +125,7 @@ async def create_default_admin():
     """
     from sqlalchemy import text
     from datetime import datetime
-    from src.utils.security import get_password_hash
+    from src.utils.security import ahash_password
     
     try:
         logger.info("Проверка наличия администратора по умолчанию...")
@@ -98,7 +143,7 @@ async def create_default_admin():
             return
 
         # Создаем администратора через прямой SQL запрос с литеральным значением роли
-        hashed_password = get_password_hash("admin")
+        hashed_password = await ahash_password("admin")
         
         # SQL-запрос с явно указанным литералом 'admin' для поля role
         async with engine.begin() as conn:
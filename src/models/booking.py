@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -26,7 +26,11 @@ class PaymentStatus(str, enum.Enum):
 class Booking(SrcDbAdapterBase):
     """Модель бронирования"""
     __tablename__ = "bookings"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_booking_service", "service_id"),
+        Index("ix_booking_company_status_start", "company_id", "status", "start_time"),
+        {'extend_existing': True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 import enum
 from typing import Dict, List, Optional, Any
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Index, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -53,10 +53,15 @@ class Schedule(SrcDbAdapterBase):
 class TimeSlot(SrcDbAdapterBase):
     """Модель временного слота для бронирования"""
     __tablename__ = "time_slots"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Один слот на интервал расписания; используется в ON CONFLICT при генерации.
+        # Префикс (schedule_id, start_time) обслуживает выборки слотов расписания по диапазону
+        Index("ix_timeslot_schedule_start_end", "schedule_id", "start_time", "end_time", unique=True),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    schedule_id = Column(Integer, ForeignKey("schedules.id"), nullable=False, index=True)
+    schedule_id = Column(Integer, ForeignKey("schedules.id"), nullable=False)
     start_time = Column(DateTime, nullable=False, index=True)
     end_time = Column(DateTime, nullable=False)
     max_clients = Column(Integer, default=1, nullable=False)  # Максимальное количество клиентов
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -9,7 +9,15 @@ from src.db_adapter import Base as SrcDbAdapterBase
 class Service(SrcDbAdapterBase):
     """Модель для хранения услуг компаний"""
     __tablename__ = "services"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_service_company_booking_count", "company_id", "booking_count"),
+        # Триграммные индексы для поиска по ILIKE '%term%' (требуют pg_trgm)
+        Index("ix_service_name_trgm", "name", postgresql_using="gin",
+              postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_service_desc_trgm", "description", postgresql_using="gin",
+              postgresql_ops={"description": "gin_trgm_ops"}),
+        {'extend_existing': True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
@@ -19,6 +27,9 @@ class Service(SrcDbAdapterBase):
     duration = Column(Integer, default=60)  # продолжительность в минутах
     is_active = Column(Boolean, default=True)
     
+    # Счетчик бронирований, поддерживается триггерами БД на bookings (для выборки популярных услуг)
+    booking_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     # Доп. информация (может быть использована для расширения)
     category = Column(String(100), nullable=True)
     tags = Column(String(255), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, JSON, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, JSON, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -76,13 +76,17 @@ class UserRole(str, enum.Enum):
 class User(SrcDbAdapterBase):
     """Модель пользователя"""
     __tablename__ = "users"
+    __table_args__ = (
+        # Покрывает выборку по роли с сортировкой/пагинацией по id
+        Index("ix_user_role_id", "role", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     first_name = Column(String, nullable=True)
     last_name = Column(String, nullable=True)
-    phone = Column(String, unique=True, nullable=True)
+    phone = Column(String, unique=True, index=True, nullable=True)
     avatar = Column(String, nullable=True, default=None)
     is_active = Column(Boolean, default=True)
     # Используем String с конвертером типов вместо Enum для избежания проблем с регистром
@@ -259,6 +259,63 @@ class BookingRepository:
         result = await db.execute(query)
         return result.scalar_one() or 0
     
+    @staticmethod
+    async def get_dashboard_counts(db: AsyncSession, company_id: int):
+        """
+        Подсчет активных бронирований и услуг компании одним запросом
+        
+        Args:
+            db: Сессия базы данных
+            company_id: ID компании
+            
+        Returns:
+            Кортеж (количество активных бронирований, количество услуг)
+        """
+        active_bookings = select(func.count(Booking.id)).join(
+            Service, Booking.service_id == Service.id
+        ).where(
+            Service.company_id == company_id,
+            Booking.status.in_(["pending", "confirmed"])
+        ).scalar_subquery()
+        
+        services = select(func.count(Service.id)).where(
+            Service.company_id == company_id
+        ).scalar_subquery()
+        
+        result = await db.execute(select(active_bookings, services))
+        active_bookings_count, services_count = result.one()
+        return active_bookings_count or 0, services_count or 0
+    
+    @staticmethod
+    async def get_company_booking_stats(db: AsyncSession, company_id: int, start_date, end_date):
+        """
+        Статистика бронирований компании по статусам за период.
+        Агрегация выполняется в базе данных одним запросом с GROUP BY.
+        
+        Args:
+            db: Сессия базы данных
+            company_id: ID компании
+            start_date: Начальная дата
+            end_date: Конечная дата
+            
+        Returns:
+            Словарь {статус: {"count": количество, "revenue": сумма}}
+        """
+        query = select(
+            Booking.status,
+            func.count(Booking.id).label("n"),
+            func.coalesce(func.sum(Booking.price), 0).label("rev")
+        ).where(
+            Booking.company_id == company_id,
+            Booking.start_time.between(start_date, end_date)
+        ).group_by(Booking.status)
+        
+        result = await db.execute(query)
+        return {
+            row.status: {"count": row.n, "revenue": float(row.rev)}
+            for row in result
+        }
+    
     @staticmethod
     async def get_recent_by_company(db: AsyncSession, company_id: int, limit: int = 5):
         """
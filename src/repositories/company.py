@@ -1,14 +1,15 @@
 """
 Репозиторий для работы с компаниями
 """
-from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from sqlalchemy import select, update, delete, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.db_adapter import get_db
 from src.models.company import Company
+from src.utils.dates import to_db_datetime
 
 
 class CompanyRepository:
@@ -17,17 +18,24 @@ class CompanyRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
-    async def get_by_id(self, company_id: int) -> Optional[Company]:
+    async def get_by_id(self, company_id: int, eager: bool = False) -> Optional[Company]:
         """
         Получить компанию по ID
         
         Args:
             company_id: ID компании
+            eager: Сразу загрузить филиалы и рабочие часы компании
+                (для страниц, которые их отображают)
             
         Returns:
             Объект компании или None
         """
         query = select(Company).where(Company.id == company_id)
+        if eager:
+            query = query.options(
+                selectinload(Company.locations),
+                selectinload(Company.working_hours)
+            )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
@@ -80,7 +88,7 @@ class CompanyRepository:
             if hasattr(company, key):
                 setattr(company, key, value)
         
-        company.updated_at = datetime.utcnow()
+        company.updated_at = to_db_datetime()
         await self.db.commit()
         await self.db.refresh(company)
         return company
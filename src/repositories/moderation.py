@@ -94,7 +94,7 @@ class ModerationRepository:
             update(ModerationRecord)
             .where(ModerationRecord.id == record_id)
             .values(
-                status=data.status,
+                status=data.status.value,
                 moderation_notes=data.moderation_notes,
                 moderator_id=moderator_id
             )
@@ -1,11 +1,52 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime, time, timedelta
+from typing import List, Optional, Dict, Any, Iterator
+from datetime import datetime, date, time, timedelta
+from threading import Lock
+from types import SimpleNamespace
+from cachetools import TTLCache
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, extract
+from sqlalchemy import func, and_, or_, extract, update, case, select
 
 from src.models.schedule import Schedule, TimeSlot
 from src.schemas.schedule import ScheduleCreate, ScheduleUpdate, TimeSlotCreate, TimeSlotUpdate
 
+# Размер порции при потоковом чтении временных слотов
+TIME_SLOTS_YIELD_PER = 500
+
+# Кэш недельного расписания компаний: company_id -> {day_of_week: снимок расписания}.
+# Сбрасывается при создании, изменении и удалении расписания компании.
+week_schedule_cache = TTLCache(maxsize=1024, ttl=300)
+_week_schedule_cache_lock = Lock()
+
+# Поля расписания, которые приходят строкой "HH:MM" и хранятся как time
+_SCHEDULE_TIME_FIELDS = ("opening_time", "closing_time", "break_start_time", "break_end_time")
+
+
+def _schedule_snapshot(schedule: Schedule) -> SimpleNamespace:
+    """Снимок значений колонок расписания, не привязанный к сессии"""
+    return SimpleNamespace(**{
+        column.key: getattr(schedule, column.key) for column in Schedule.__table__.columns
+    })
+
+
+def _changed_fields(data: BaseModel, exclude_none: bool = False) -> Dict[str, Any]:
+    """Значения только явно переданных полей схемы, без выгрузки остальных"""
+    changed = {}
+    for name in data.model_fields_set:
+        value = getattr(data, name)
+        if value is None and exclude_none:
+            continue
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        changed[name] = value
+    return changed
+
+
+def invalidate_week_schedule_cache(company_id: int) -> None:
+    """Сброс кэшированного недельного расписания компании"""
+    with _week_schedule_cache_lock:
+        week_schedule_cache.pop(company_id, None)
+
 
 class ScheduleRepository:
     """Репозиторий для работы с расписанием"""
@@ -14,13 +55,13 @@ class ScheduleRepository:
     def create_schedule(db: Session, schedule_data: ScheduleCreate) -> Schedule:
         """Создание нового расписания"""
         # Преобразование строковых представлений времени в объекты time
-        opening_time = datetime.strptime(schedule_data.opening_time, "%H:%M").time() if schedule_data.opening_time else None
-        closing_time = datetime.strptime(schedule_data.closing_time, "%H:%M").time() if schedule_data.closing_time else None
-        break_start_time = datetime.strptime(schedule_data.break_start_time, "%H:%M").time() if schedule_data.break_start_time else None
-        break_end_time = datetime.strptime(schedule_data.break_end_time, "%H:%M").time() if schedule_data.break_end_time else None
+        opening_time = time.fromisoformat(schedule_data.opening_time) if schedule_data.opening_time else None
+        closing_time = time.fromisoformat(schedule_data.closing_time) if schedule_data.closing_time else None
+        break_start_time = time.fromisoformat(schedule_data.break_start_time) if schedule_data.break_start_time else None
+        break_end_time = time.fromisoformat(schedule_data.break_end_time) if schedule_data.break_end_time else None
         
         # Преобразование даты для особого дня
-        specific_date = datetime.strptime(schedule_data.specific_date, "%Y-%m-%d") if schedule_data.specific_date else None
+        specific_date = date.fromisoformat(schedule_data.specific_date) if schedule_data.specific_date else None
         
         # Создание объекта расписания
         db_schedule = Schedule(
@@ -41,33 +82,44 @@ class ScheduleRepository:
         db.commit()
         db.refresh(db_schedule)
         
+        invalidate_week_schedule_cache(db_schedule.company_id)
+        
         return db_schedule
     
     @staticmethod
     def update_schedule(db: Session, schedule_id: int, schedule_data: ScheduleUpdate) -> Optional[Schedule]:
         """Обновление расписания"""
-        db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
-        
-        if not db_schedule:
-            return None
-        
         # Обновляем только те поля, которые переданы и не None
-        update_data = schedule_data.dict(exclude_unset=True)
+        update_data = _changed_fields(schedule_data)
         
-        # Преобразование времени из строки в объекты time
-        for field in ['opening_time', 'closing_time', 'break_start_time', 'break_end_time']:
-            if field in update_data and update_data[field]:
-                update_data[field] = datetime.strptime(update_data[field], "%H:%M").time()
+        # Преобразование времени из строки в объекты time (уже готовые значения не трогаем)
+        for field in _SCHEDULE_TIME_FIELDS:
+            value = update_data.get(field)
+            if value and isinstance(value, str):
+                update_data[field] = time.fromisoformat(value)
         
         # Преобразование даты из строки
-        if 'specific_date' in update_data and update_data['specific_date']:
-            update_data['specific_date'] = datetime.strptime(update_data['specific_date'], "%Y-%m-%d")
+        specific_date = update_data.get('specific_date')
+        if specific_date and isinstance(specific_date, str):
+            update_data['specific_date'] = date.fromisoformat(specific_date)
+        
+        if not update_data:
+            return ScheduleRepository.get_schedule_by_id(db, schedule_id)
+        
+        # Один UPDATE ... RETURNING вместо SELECT + изменения объекта + refresh
+        stmt = update(Schedule).where(
+            Schedule.id == schedule_id
+        ).values(**update_data).returning(Schedule)
         
-        for key, value in update_data.items():
-            setattr(db_schedule, key, value)
+        db_schedule = db.execute(stmt).scalar_one_or_none()
+        
+        if not db_schedule:
+            db.rollback()
+            return None
         
         db.commit()
-        db.refresh(db_schedule)
+        
+        invalidate_week_schedule_cache(db_schedule.company_id)
         
         return db_schedule
     
@@ -79,9 +131,12 @@ class ScheduleRepository:
         if not db_schedule:
             return False
         
+        company_id = db_schedule.company_id
         db.delete(db_schedule)
         db.commit()
         
+        invalidate_week_schedule_cache(company_id)
+        
         return True
     
     @staticmethod
@@ -95,28 +150,45 @@ class ScheduleRepository:
         return db.query(Schedule).filter(Schedule.company_id == company_id).all()
     
     @staticmethod
-    def get_company_week_schedule(db: Session, company_id: int) -> Dict[int, Schedule]:
-        """Получение расписания компании на неделю"""
-        # Получаем стандартное расписание на неделю
-        week_schedules = db.query(Schedule).filter(
-            Schedule.company_id == company_id,
-            Schedule.is_special_day == False
-        ).all()
-        
-        # Преобразуем в словарь для удобного доступа
-        schedule_by_day = {schedule.day_of_week: schedule for schedule in week_schedules}
+    def get_company_week_schedule(db: Session, company_id: int) -> Dict[int, SimpleNamespace]:
+        """
+        Получение расписания компании на неделю.
+        Результат кэшируется в week_schedule_cache в виде снимков, не привязанных к сессии.
+        """
+        with _week_schedule_cache_lock:
+            schedule_by_day = week_schedule_cache.get(company_id)
+        
+        if schedule_by_day is None:
+            # Получаем стандартное расписание на неделю
+            week_schedules = db.query(Schedule).filter(
+                Schedule.company_id == company_id,
+                Schedule.is_special_day == False
+            ).all()
+            
+            # Преобразуем в словарь для удобного доступа
+            schedule_by_day = {
+                schedule.day_of_week: _schedule_snapshot(schedule) for schedule in week_schedules
+            }
+            
+            with _week_schedule_cache_lock:
+                week_schedule_cache[company_id] = schedule_by_day
         
-        return schedule_by_day
+        return dict(schedule_by_day)
     
     @staticmethod
     def get_company_special_day_schedules(db: Session, company_id: int, 
                                          start_date: datetime, end_date: datetime) -> List[Schedule]:
         """Получение особых дней для компании в заданном диапазоне дат"""
+        # specific_date хранит дату, поэтому сравниваем с датами, а не с datetime
+        if isinstance(start_date, datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        
         return db.query(Schedule).filter(
             Schedule.company_id == company_id,
             Schedule.is_special_day == True,
-            Schedule.specific_date >= start_date,
-            Schedule.specific_date <= end_date
+            Schedule.specific_date.between(start_date, end_date)
         ).all()
     
     @staticmethod
@@ -126,11 +198,13 @@ class ScheduleRepository:
         Сначала проверяет, есть ли особый день на эту дату, 
         если нет - возвращает стандартное расписание для дня недели.
         """
+        target_date = date.date() if isinstance(date, datetime) else date
+        
         # Проверяем, есть ли особый день на эту дату
         special_day = db.query(Schedule).filter(
             Schedule.company_id == company_id,
             Schedule.is_special_day == True,
-            Schedule.specific_date == date.date()  # Сравниваем только дату
+            Schedule.specific_date == target_date
         ).first()
         
         if special_day:
@@ -153,7 +227,7 @@ class TimeSlotRepository:
     def create_time_slot(db: Session, slot_data: TimeSlotCreate) -> TimeSlot:
         """Создание нового временного слота"""
         # Преобразуем строковое представление времени в datetime
-        start_time = datetime.strptime(slot_data.start_time, "%Y-%m-%d %H:%M")
+        start_time = datetime.fromisoformat(slot_data.start_time)
         
         db_time_slot = TimeSlot(
             service_id=slot_data.service_id,
@@ -174,33 +248,42 @@ class TimeSlotRepository:
     @staticmethod
     def update_time_slot(db: Session, slot_id: int, slot_data: TimeSlotUpdate) -> Optional[TimeSlot]:
         """Обновление временного слота"""
-        db_time_slot = db.query(TimeSlot).filter(TimeSlot.id == slot_id).first()
-        
-        if not db_time_slot:
-            return None
-        
         # Обновляем только те поля, которые переданы и не None
-        update_data = slot_data.dict(exclude_unset=True, exclude_none=True)
+        update_data = _changed_fields(slot_data, exclude_none=True)
         
         # Преобразуем строковое представление времени в datetime
-        if 'start_time' in update_data and update_data['start_time']:
-            update_data['start_time'] = datetime.strptime(update_data['start_time'], "%Y-%m-%d %H:%M")
+        start_time = update_data.get('start_time')
+        if start_time and isinstance(start_time, str):
+            update_data['start_time'] = datetime.fromisoformat(start_time)
         
         # Если изменился статус блокировки, обновляем также статус слота
         if 'is_blocked' in update_data:
             if update_data['is_blocked']:
                 update_data['status'] = "blocked"
-            elif db_time_slot.status == "blocked":
-                # Если слот был заблокирован, а теперь разблокирован
-                update_data['status'] = "available" if db_time_slot.booked_clients == 0 else (
-                    "booked" if db_time_slot.booked_clients >= db_time_slot.max_clients else "partially_booked"
+            else:
+                # Если слот был заблокирован, а теперь разблокирован, статус
+                # пересчитывается по текущему числу бронирований прямо в БД
+                update_data['status'] = case(
+                    (TimeSlot.status != "blocked", TimeSlot.status),
+                    (TimeSlot.booked_clients == 0, "available"),
+                    (TimeSlot.booked_clients >= TimeSlot.max_clients, "booked"),
+                    else_="partially_booked"
                 )
         
-        for key, value in update_data.items():
-            setattr(db_time_slot, key, value)
+        if not update_data:
+            return TimeSlotRepository.get_time_slot_by_id(db, slot_id)
+        
+        stmt = update(TimeSlot).where(
+            TimeSlot.id == slot_id
+        ).values(**update_data).returning(TimeSlot)
+        
+        db_time_slot = db.execute(stmt).scalar_one_or_none()
+        
+        if not db_time_slot:
+            db.rollback()
+            return None
         
         db.commit()
-        db.refresh(db_time_slot)
         
         return db_time_slot
     
@@ -227,69 +310,96 @@ class TimeSlotRepository:
                               start_date: Optional[datetime] = None,
                               end_date: Optional[datetime] = None) -> List[TimeSlot]:
         """Получение временных слотов для услуги"""
-        query = db.query(TimeSlot).filter(TimeSlot.service_id == service_id)
+        return list(TimeSlotRepository.iter_service_time_slots(db, service_id, start_date, end_date))
+    
+    @staticmethod
+    def iter_service_time_slots(db: Session, service_id: int, 
+                               start_date: Optional[datetime] = None,
+                               end_date: Optional[datetime] = None) -> Iterator[TimeSlot]:
+        """
+        Потоковое получение временных слотов для услуги.
+        Строки читаются из БД порциями по TIME_SLOTS_YIELD_PER, а не все сразу.
+        """
+        stmt = select(TimeSlot).where(TimeSlot.service_id == service_id)
         
         if start_date:
-            query = query.filter(TimeSlot.start_time >= start_date)
+            stmt = stmt.where(TimeSlot.start_time >= start_date)
         
         if end_date:
-            query = query.filter(TimeSlot.start_time <= end_date)
+            stmt = stmt.where(TimeSlot.start_time <= end_date)
+        
+        stmt = stmt.order_by(TimeSlot.start_time).execution_options(yield_per=TIME_SLOTS_YIELD_PER)
         
-        return query.order_by(TimeSlot.start_time).all()
+        yield from db.scalars(stmt)
     
     @staticmethod
     def get_available_time_slots(db: Session, service_id: int, 
                                 start_date: datetime, end_date: datetime) -> List[TimeSlot]:
         """Получение доступных для бронирования временных слотов"""
-        return db.query(TimeSlot).filter(
+        return list(TimeSlotRepository.iter_available_time_slots(db, service_id, start_date, end_date))
+    
+    @staticmethod
+    def iter_available_time_slots(db: Session, service_id: int, 
+                                 start_date: datetime, end_date: datetime) -> Iterator[TimeSlot]:
+        """Потоковое получение доступных для бронирования временных слотов"""
+        stmt = select(TimeSlot).where(
             TimeSlot.service_id == service_id,
             TimeSlot.start_time >= start_date,
             TimeSlot.start_time <= end_date,
             TimeSlot.is_blocked == False,
             TimeSlot.status.in_(["available", "partially_booked"])
-        ).order_by(TimeSlot.start_time).all()
+        ).order_by(TimeSlot.start_time).execution_options(yield_per=TIME_SLOTS_YIELD_PER)
+        
+        yield from db.scalars(stmt)
     
     @staticmethod
     def book_time_slot(db: Session, slot_id: int) -> Optional[TimeSlot]:
         """Бронирование слота (увеличение счетчика клиентов и обновление статуса)"""
-        db_time_slot = db.query(TimeSlot).filter(TimeSlot.id == slot_id).first()
-        
-        if not db_time_slot or db_time_slot.is_blocked or db_time_slot.status == "booked":
-            return None
+        # Один атомарный UPDATE вместо чтения и записи: два одновременных
+        # бронирования не смогут превысить max_clients
+        stmt = update(TimeSlot).where(
+            TimeSlot.id == slot_id,
+            TimeSlot.is_blocked == False,
+            TimeSlot.booked_clients < TimeSlot.max_clients
+        ).values(
+            booked_clients=TimeSlot.booked_clients + 1,
+            status=case(
+                (TimeSlot.booked_clients + 1 >= TimeSlot.max_clients, "booked"),
+                else_="partially_booked"
+            )
+        ).returning(TimeSlot)
         
-        # Увеличиваем счетчик клиентов
-        db_time_slot.booked_clients += 1
+        db_time_slot = db.execute(stmt).scalar_one_or_none()
         
-        # Обновляем статус
-        if db_time_slot.booked_clients >= db_time_slot.max_clients:
-            db_time_slot.status = "booked"
-        else:
-            db_time_slot.status = "partially_booked"
+        if not db_time_slot:
+            db.rollback()
+            return None
         
         db.commit()
-        db.refresh(db_time_slot)
         
         return db_time_slot
     
     @staticmethod
     def cancel_booking(db: Session, slot_id: int) -> Optional[TimeSlot]:
         """Отмена бронирования (уменьшение счетчика клиентов и обновление статуса)"""
-        db_time_slot = db.query(TimeSlot).filter(TimeSlot.id == slot_id).first()
-        
-        if not db_time_slot or db_time_slot.booked_clients == 0:
-            return None
+        stmt = update(TimeSlot).where(
+            TimeSlot.id == slot_id,
+            TimeSlot.booked_clients > 0
+        ).values(
+            booked_clients=TimeSlot.booked_clients - 1,
+            status=case(
+                (TimeSlot.booked_clients - 1 == 0, "available"),
+                else_="partially_booked"
+            )
+        ).returning(TimeSlot)
         
-        # Уменьшаем счетчик клиентов
-        db_time_slot.booked_clients -= 1
+        db_time_slot = db.execute(stmt).scalar_one_or_none()
         
-        # Обновляем статус
-        if db_time_slot.booked_clients == 0:
-            db_time_slot.status = "available"
-        else:
-            db_time_slot.status = "partially_booked"
+        if not db_time_slot:
+            db.rollback()
+            return None
         
         db.commit()
-        db.refresh(db_time_slot)
         
         return db_time_slot
     
@@ -398,16 +508,9 @@ class TimeSlotRepository:
                     # Проверка, не попадает ли слот на перерыв
                     slot_end = time_pointer + timedelta(minutes=duration)
                     
-                    # Если слот пересекается с перерывом, пропускаем его
-                    if break_start and break_end and (
-                        (time_pointer < break_end and slot_end > break_start) or
-                        (time_pointer >= break_start and time_pointer < break_end)
-                    ):
-                        # Переходим через перерыв, если мы в начале перерыва
-                        if time_pointer < break_start:
-                            time_pointer = break_end
-                        else:
-                            time_pointer += timedelta(minutes=interval)
+                    # Если слот пересекается с перерывом, сразу переходим на конец перерыва
+                    if break_end and time_pointer < break_end and slot_end > break_start:
+                        time_pointer = break_end
                         continue
                     
                     # Проверяем, что слот полностью помещается в рабочий день
@@ -1,9 +1,11 @@
+import asyncio
+from typing import Callable, List, Tuple
+
 from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.models.service import Service
-from src.models.booking import Booking
 from src.schemas.service import ServiceCreate, ServiceUpdate
 from src.core.errors import NotFoundError
 
@@ -46,7 +48,7 @@ class ServiceRepository:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_all(db: AsyncSession, skip: int = 0, limit: int = 100):
+    async def get_all(db: AsyncSession, skip: int = 0, limit: int = 100, include_company: bool = False):
         """
         Получение всех услуг с пагинацией
         
@@ -54,13 +56,15 @@ class ServiceRepository:
             db: Сессия базы данных
             skip: Сколько записей пропустить
             limit: Сколько записей вернуть
+            include_company: Загружать ли связанную компанию
             
         Returns:
             Список услуг
         """
-        query = select(Service).options(
-            joinedload(Service.company)
-        ).offset(skip).limit(limit)
+        query = select(Service).offset(skip).limit(limit)
+        
+        if include_company:
+            query = query.options(selectinload(Service.company))
         
         result = await db.execute(query)
         return result.scalars().all()
@@ -85,8 +89,9 @@ class ServiceRepository:
         if not service:
             raise NotFoundError(f"Услуга с ID {service_id} не найдена")
         
-        for key, value in service_data.model_dump(exclude_unset=True).items():
-            setattr(service, key, value)
+        # Перебираем только явно переданные поля, не выгружая всю схему
+        for key in service_data.model_fields_set:
+            setattr(service, key, getattr(service_data, key))
         
         await db.commit()
         await db.refresh(service)
@@ -137,7 +142,8 @@ class ServiceRepository:
         return result.scalars().all()
     
     @staticmethod
-    async def search(db: AsyncSession, search_term: str, skip: int = 0, limit: int = 100):
+    async def search(db: AsyncSession, search_term: str, skip: int = 0, limit: int = 100,
+                     include_company: bool = False):
         """
         Поиск услуг по названию или описанию
         
@@ -146,23 +152,27 @@ class ServiceRepository:
             search_term: Поисковый запрос
             skip: Сколько записей пропустить
             limit: Сколько записей вернуть
+            include_company: Загружать ли связанную компанию
             
         Returns:
             Список найденных услуг
         """
+        # ILIKE по name/description обслуживается триграммными GIN-индексами
         search_pattern = f"%{search_term}%"
-        query = select(Service).options(
-            joinedload(Service.company)
-        ).where(
+        query = select(Service).where(
             (Service.name.ilike(search_pattern)) | 
             (Service.description.ilike(search_pattern))
         ).offset(skip).limit(limit)
         
+        if include_company:
+            query = query.options(selectinload(Service.company))
+        
         result = await db.execute(query)
         return result.scalars().all()
     
     @staticmethod
-    async def get_by_category(db: AsyncSession, category_id: int, skip: int = 0, limit: int = 100):
+    async def get_by_category(db: AsyncSession, category_id: int, skip: int = 0, limit: int = 100,
+                              include_company: bool = False):
         """
         Получение услуг по категории
         
@@ -171,16 +181,18 @@ class ServiceRepository:
             category_id: ID категории
             skip: Сколько записей пропустить
             limit: Сколько записей вернуть
+            include_company: Загружать ли связанную компанию
             
         Returns:
             Список услуг в категории
         """
-        query = select(Service).options(
-            joinedload(Service.company)
-        ).where(
+        query = select(Service).where(
             Service.category_id == category_id
         ).offset(skip).limit(limit)
         
+        if include_company:
+            query = query.options(selectinload(Service.company))
+        
         result = await db.execute(query)
         return result.scalars().all()
     
@@ -203,6 +215,30 @@ class ServiceRepository:
         result = await db.execute(query)
         return result.scalar_one() or 0
     
+    @staticmethod
+    async def list_and_count(db_factory: Callable[[], AsyncSession], company_id: int,
+                             skip: int = 0, limit: int = 100) -> Tuple[List[Service], int]:
+        """
+        Получение услуг компании вместе с их общим количеством.
+        Оба запроса выполняются параллельно в отдельных сессиях.
+        
+        Args:
+            db_factory: Фабрика сессий базы данных
+            company_id: ID компании
+            skip: Сколько записей пропустить
+            limit: Сколько записей вернуть
+            
+        Returns:
+            Кортеж (список услуг компании, количество услуг)
+        """
+        async with db_factory() as count_db, db_factory() as list_db:
+            total, services = await asyncio.gather(
+                ServiceRepository.count_by_company(count_db, company_id),
+                ServiceRepository.get_by_company(list_db, company_id, skip, limit)
+            )
+        
+        return services, total
+    
     @staticmethod
     async def get_popular_by_company(db: AsyncSession, company_id: int, limit: int = 5):
         """
@@ -216,17 +252,15 @@ class ServiceRepository:
         Returns:
             Список популярных услуг с количеством бронирований
         """
+        # Счетчик booking_count поддерживается триггерами на bookings, поэтому
+        # соединение с таблицей бронирований и группировка не нужны
         query = select(
             Service,
-            func.count(Booking.id).label('booking_count')
-        ).join(
-            Booking, Service.id == Booking.service_id, isouter=True
+            Service.booking_count.label('booking_count')
         ).where(
             Service.company_id == company_id
-        ).group_by(
-            Service.id
         ).order_by(
-            func.count(Booking.id).desc()
+            Service.booking_count.desc()
         ).limit(limit)
         
         result = await db.execute(query)
@@ -2,13 +2,64 @@
 Репозиторий для работы с пользователями
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Tuple, AsyncIterator
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, bindparam, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.db_adapter import get_db
 from src.models.user import User, UserRole
+from src.utils.dates import to_db_datetime
+
+
+def _user_list_columns():
+    """Опция загрузки колонок пользователя для списков"""
+    return load_only(
+        User.id, User.email, User.phone, User.first_name, User.last_name,
+        User.role, User.avatar, User.is_active, User.is_superuser, User.created_at
+    )
+
+
+# Допустимые значения роли в базе данных
+_USER_ROLE_VALUES = frozenset(role.value for role in UserRole)
+
+# Размер порции строк при потоковой выгрузке пользователей
+USERS_STREAM_YIELD_PER = 256
+
+
+# Запросы собираются один раз при импорте: значения передаются только через
+# bind-параметры, поэтому скомпилированный SQL переиспользуется из кэша SQLAlchemy
+_GET_USER_BY_EMAIL = lambda_stmt(lambda: select(User).where(User.email == bindparam("email")))
+_GET_USER_BY_PHONE = lambda_stmt(lambda: select(User).where(User.phone == bindparam("phone")))
+# Выборка по списку значений: expanding-параметр раскрывается при выполнении,
+# а сам запрос остается в кэше независимо от длины списка
+_GET_USERS_BY_IDS = lambda_stmt(
+    lambda: select(User).where(User.id.in_(bindparam("user_ids", expanding=True)))
+)
+_GET_USERS_BY_EMAILS = lambda_stmt(
+    lambda: select(User).where(User.email.in_(bindparam("emails", expanding=True)))
+)
+# Списки загружают только поля, нужные UserResponse (без хеша пароля,
+# Telegram-данных и updated_at); полный объект возвращает get_by_id
+_GET_ALL_USERS = lambda_stmt(
+    lambda: select(User).options(_user_list_columns())
+    .order_by(User.id).offset(bindparam("skip")).limit(bindparam("limit"))
+)
+_GET_USERS_BY_ROLE = lambda_stmt(
+    lambda: select(User).options(_user_list_columns()).where(User.role == bindparam("role"))
+    .order_by(User.id).offset(bindparam("skip")).limit(bindparam("limit"))
+)
+# Keyset-пагинация: страница начинается сразу после последнего полученного id
+_LIST_USERS_AFTER = lambda_stmt(
+    lambda: select(User).options(_user_list_columns()).where(User.id > bindparam("last_id"))
+    .order_by(User.id).limit(bindparam("limit"))
+)
+_LIST_USERS_BY_ROLE_AFTER = lambda_stmt(
+    lambda: select(User).options(_user_list_columns())
+    .where(User.role == bindparam("role"), User.id > bindparam("last_id"))
+    .order_by(User.id).limit(bindparam("limit"))
+)
 
 
 class UserRepository:
@@ -27,9 +78,26 @@ class UserRepository:
         Returns:
             Объект пользователя или None
         """
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        # session.get сначала проверяет identity map и не делает SELECT,
+        # если пользователь уже загружен в этой сессии
+        return await self.db.get(User, user_id)
+    
+    async def get_many_by_ids(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """
+        Получить пользователей по списку ID одним запросом
+        
+        Args:
+            user_ids: ID пользователей
+            
+        Returns:
+            Словарь {ID: пользователь} для найденных пользователей
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return {}
+        
+        result = await self.db.execute(_GET_USERS_BY_IDS, {"user_ids": list(user_ids)})
+        return {user.id: user for user in result.scalars().all()}
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -41,10 +109,26 @@ class UserRepository:
         Returns:
             Объект пользователя или None
         """
-        query = select(User).where(User.email == email)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_GET_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     
+    async def get_many_by_emails(self, emails: Iterable[str]) -> Dict[str, User]:
+        """
+        Получить пользователей по списку email одним запросом
+        
+        Args:
+            emails: Email пользователей
+            
+        Returns:
+            Словарь {email: пользователь} для найденных пользователей
+        """
+        emails = set(emails)
+        if not emails:
+            return {}
+        
+        result = await self.db.execute(_GET_USERS_BY_EMAILS, {"emails": list(emails)})
+        return {user.email: user for user in result.scalars().all()}
+    
     async def get_by_phone(self, phone: str) -> Optional[User]:
         """
         Получить пользователя по телефону
@@ -55,8 +139,7 @@ class UserRepository:
         Returns:
             Объект пользователя или None
         """
-        query = select(User).where(User.phone == phone)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_GET_USER_BY_PHONE, {"phone": phone})
         return result.scalar_one_or_none()
     
     async def create(self, user_data: dict) -> User:
@@ -70,47 +153,47 @@ class UserRepository:
             Объект созданного пользователя
         """
         # Если передана роль, убедимся, что она в правильном регистре (нижнем)
-        if "role" in user_data:
-            # Если роль - это строка в верхнем регистре, преобразуем её в нижний
-            if isinstance(user_data["role"], str):
-                user_data["role"] = user_data["role"].lower()
+        user_data = self._normalize_role(user_data)
         
         user = User(**user_data)
         self.db.add(user)
+        # INSERT ... RETURNING при flush внутри commit заполняет id и значения по умолчанию,
+        # а сессия не сбрасывает атрибуты при commit, поэтому refresh не нужен
         await self.db.commit()
-        await self.db.refresh(user)
         return user
     
-    async def update(self, user_id: int, user_data: dict) -> Optional[User]:
+    async def update(self, user_id: int, user_data: dict,
+                     now: Optional[datetime] = None) -> Optional[User]:
         """
         Обновить данные пользователя
         
         Args:
             user_id: ID пользователя
             user_data: Новые данные пользователя
+            now: Время изменения (например, request_now(request));
+                по умолчанию текущее время в UTC
             
         Returns:
             Объект обновленного пользователя или None
         """
-        user = await self.get_by_id(user_id)
+        user_data = self._normalize_role(user_data)
+        
+        # Один UPDATE ... RETURNING вместо SELECT + UPDATE + refresh
+        query = (
+            update(User)
+            .where(User.id == user_id)
+            .values({**user_data, "updated_at": to_db_datetime(now)})
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        user = result.scalar_one_or_none()
+        
         if not user:
+            await self.db.rollback()
             return None
         
-        # Предварительная обработка ролей
-        if "role" in user_data:
-            # Если роль - это строка или enum, преобразуем их в строку нижнего регистра
-            if isinstance(user_data["role"], str):
-                user_data["role"] = user_data["role"].lower()
-            elif hasattr(user_data["role"], "value"):
-                # Если это enum с атрибутом value
-                user_data["role"] = user_data["role"].value.lower()
-
-        for key, value in user_data.items():
-            setattr(user, key, value)
-        
-        user.updated_at = datetime.utcnow()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
     
     async def delete(self, user_id: int) -> bool:
@@ -131,9 +214,55 @@ class UserRepository:
         await self.db.commit()
         return True
     
+    @staticmethod
+    def _normalize_role(user_data: dict) -> dict:
+        """
+        Привести роль в данных пользователя к строке в нижнем регистре
+        
+        Args:
+            user_data: Данные пользователя
+            
+        Returns:
+            Те же данные с нормализованной ролью
+        """
+        if "role" in user_data:
+            # Если роль - это строка или enum, преобразуем их в строку нижнего регистра
+            if isinstance(user_data["role"], str):
+                user_data["role"] = user_data["role"].lower()
+            elif hasattr(user_data["role"], "value"):
+                # Если это enum с атрибутом value
+                user_data["role"] = user_data["role"].value.lower()
+        return user_data
+    
+    @staticmethod
+    def _resolve_role(role) -> str:
+        """
+        Привести роль к значению, которое хранится в базе данных.
+        Выполняется один раз до запроса, а не при сравнении каждой строки.
+        
+        Args:
+            role: Роль пользователя (строка или UserRole)
+            
+        Returns:
+            Значение роли в нижнем регистре
+            
+        Raises:
+            ValueError: Если роль неизвестна
+        """
+        if isinstance(role, UserRole):
+            return role.value
+        value = str.lower(role)
+        if value not in _USER_ROLE_VALUES:
+            raise ValueError(
+                f"Недопустимая роль. Должна быть одна из: {', '.join(sorted(_USER_ROLE_VALUES))}"
+            )
+        return value
+    
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         """
-        Получить список пользователей
+        Получить список пользователей.
+        Для глубоких страниц используйте list_after: OFFSET заставляет БД
+        перебирать и отбрасывать skip строк.
         
         Args:
             skip: Количество пропускаемых записей
@@ -142,13 +271,13 @@ class UserRepository:
         Returns:
             Список пользователей
         """
-        query = select(User).offset(skip).limit(limit)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_GET_ALL_USERS, {"skip": skip, "limit": limit})
         return result.scalars().all()
     
     async def get_by_role(self, role, skip: int = 0, limit: int = 100) -> List[User]:
         """
-        Получить пользователей по роли
+        Получить пользователей по роли.
+        Для глубоких страниц используйте list_by_role_after.
         
         Args:
             role: Роль пользователя (строка или UserRole)
@@ -158,10 +287,64 @@ class UserRepository:
         Returns:
             Список пользователей с указанной ролью
         """
-        # Преобразуем роль в нижний регистр, если это строка
-        if isinstance(role, str):
-            role = role.lower()
+        result = await self.db.execute(
+            _GET_USERS_BY_ROLE, {"role": self._resolve_role(role), "skip": skip, "limit": limit}
+        )
+        return result.scalars().all()
+    
+    async def list_after(self, last_id: int = 0, limit: int = 100) -> Tuple[List[User], Optional[int]]:
+        """
+        Получить страницу пользователей после указанного ID (keyset-пагинация)
+        
+        Args:
+            last_id: ID последнего пользователя предыдущей страницы (0 - с начала)
+            limit: Максимальное количество записей
             
-        query = select(User).where(User.role == role).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return result.scalars().all() 
\ No newline at end of file
+        Returns:
+            Список пользователей и курсор для следующей страницы (None, если страниц больше нет)
+        """
+        result = await self.db.execute(_LIST_USERS_AFTER, {"last_id": last_id, "limit": limit})
+        users = result.scalars().all()
+        next_cursor = users[-1].id if len(users) == limit else None
+        return users, next_cursor
+    
+    async def list_by_role_after(self, role, last_id: int = 0,
+                                 limit: int = 100) -> Tuple[List[User], Optional[int]]:
+        """
+        Получить страницу пользователей с указанной ролью после указанного ID
+        
+        Args:
+            role: Роль пользователя (строка или UserRole)
+            last_id: ID последнего пользователя предыдущей страницы (0 - с начала)
+            limit: Максимальное количество записей
+            
+        Returns:
+            Список пользователей и курсор для следующей страницы (None, если страниц больше нет)
+        """
+        result = await self.db.execute(
+            _LIST_USERS_BY_ROLE_AFTER, {"role": self._resolve_role(role), "last_id": last_id, "limit": limit}
+        )
+        users = result.scalars().all()
+        next_cursor = users[-1].id if len(users) == limit else None
+        return users, next_cursor
+    
+    async def stream_by_role(self, role=None) -> AsyncIterator[User]:
+        """
+        Потоково получить пользователей (всех или с указанной ролью).
+        Строки читаются с сервера порциями, поэтому память не зависит
+        от размера выборки.
+        
+        Args:
+            role: Роль пользователя (строка или UserRole); None - все пользователи
+            
+        Yields:
+            Объекты пользователей в порядке возрастания ID
+        """
+        query = select(User).options(_user_list_columns()).order_by(User.id)
+        if role is not None:
+            query = query.where(User.role == self._resolve_role(role))
+        query = query.execution_options(yield_per=USERS_STREAM_YIELD_PER)
+        
+        result = await self.db.stream_scalars(query)
+        async for user in result:
+            yield user
@@ -1,22 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Form, Query, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from typing import Optional, List, Dict, Any
-import json
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.db_adapter import get_db
 from src.services.auth_service import get_current_user
 from src.services.company_service import CompanyService
 from src.services.moderation_service import ModerationService
 from src.services.booking_service import BookingService
 from src.models.user import User
-from src.utils.permissions import check_company_permission
+from src.utils.permissions import get_request_company, require_company_permission
+from src.templates import templates
 
 router = APIRouter()
 
-templates = Jinja2Templates(directory="src/templates")
-
 # Существующие маршруты
 
 @router.get("/dashboard", response_class=HTMLResponse)
@@ -45,16 +42,12 @@ async def company_dashboard(
     request: Request,
     company_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_company_permission)
 ):
     """Отображает дашборд для конкретной компании"""
-    company_service = CompanyService(db)
-    
-    # Проверяем права доступа пользователя к компании
-    await check_company_permission(db, current_user, company_id)
-    
-    # Получаем данные о компании
-    company = await company_service.get_company(company_id)
+    # Права доступа проверены зависимостью require_company_permission,
+    # компания берется из кэша запроса, заполненного этой проверкой
+    company = await get_request_company(request, db, company_id)
     
     if not company:
         raise HTTPException(
@@ -97,15 +90,12 @@ async def moderation_panel(
     request: Request,
     company_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_company_permission)
 ):
     """Панель модерации для компании"""
-    # Проверяем права доступа пользователя к компании
-    await check_company_permission(db, current_user, company_id)
-    
-    # Получаем данные о компании
-    company_service = CompanyService(db)
-    company = await company_service.get_company(company_id)
+    # Права доступа проверены зависимостью require_company_permission,
+    # компания берется из кэша запроса, заполненного этой проверкой
+    company = await get_request_company(request, db, company_id)
     
     if not company:
         raise HTTPException(
@@ -134,15 +124,12 @@ async def company_schedule(
     request: Request,
     company_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_company_permission)
 ):
     """Страница управления расписанием компании"""
-    # Проверяем права доступа пользователя к компании
-    await check_company_permission(db, current_user, company_id)
-    
-    # Получаем данные о компании
-    company_service = CompanyService(db)
-    company = await company_service.get_company(company_id)
+    # Права доступа проверены зависимостью require_company_permission,
+    # компания берется из кэша запроса, заполненного этой проверкой
+    company = await get_request_company(request, db, company_id)
     
     if not company:
         raise HTTPException(
@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class AnalyticsBase(BaseModel):
@@ -70,8 +70,8 @@ class AnalyticsResponse(AnalyticsBase):
     client_statistics: AnalyticsClientStats
     created_at: datetime
     
-    class Config:
-        orm_mode = True
+    # Валидатор собирается при первом использовании, а не при импорте
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class AnalyticsCreate(AnalyticsBase):
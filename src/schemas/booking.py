@@ -1,10 +1,16 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 from src.models.booking import BookingStatus
 
+# Допустимые значения статуса и сообщение об ошибке вычисляются один раз
+_BOOKING_STATUS_VALUES = frozenset(status.value for status in BookingStatus)
+_BOOKING_STATUS_MSG = "Недопустимый статус. Должен быть одним из: " + ", ".join(
+    status.value for status in BookingStatus
+)
+
 
 class BookingBase(BaseModel):
     """Базовая схема бронирования"""
@@ -40,10 +46,11 @@ class BookingUpdate(BaseModel):
     payment_id: Optional[str] = Field(None, description="ID платежа")
     notes: Optional[str] = Field(None, description="Примечания к бронированию")
     
-    @validator("status")
+    @field_validator("status")
+    @classmethod
     def validate_status(cls, v):
-        if v is not None and v not in [status.value for status in BookingStatus]:
-            raise ValueError(f"Недопустимый статус. Должен быть одним из: {', '.join([status.value for status in BookingStatus])}")
+        if v is not None and v not in _BOOKING_STATUS_VALUES:
+            raise ValueError(_BOOKING_STATUS_MSG)
         return v
 
 
@@ -51,10 +58,11 @@ class BookingStatusUpdate(BaseModel):
     """Схема обновления статуса бронирования"""
     status: str = Field(..., description="Статус бронирования")
     
-    @validator("status")
+    @field_validator("status")
+    @classmethod
     def validate_status(cls, v):
-        if v not in [status.value for status in BookingStatus]:
-            raise ValueError(f"Недопустимый статус. Должен быть одним из: {', '.join([status.value for status in BookingStatus])}")
+        if v not in _BOOKING_STATUS_VALUES:
+            raise ValueError(_BOOKING_STATUS_MSG)
         return v
 
 
@@ -83,8 +91,7 @@ class BookingInDB(BookingBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BookingResponse(BookingBase):
@@ -100,8 +107,7 @@ class BookingResponse(BookingBase):
     price: Optional[float] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BookingDetailResponse(BookingResponse):
@@ -115,8 +121,7 @@ class BookingDetailResponse(BookingResponse):
     payment_id: Optional[str] = None
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BookingTimeSlot(BaseModel):
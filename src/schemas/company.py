@@ -1,7 +1,12 @@
-from pydantic import BaseModel, Field, EmailStr, validator, HttpUrl
+import re
+
+from pydantic import BaseModel, Field, EmailStr, field_validator, ConfigDict, HttpUrl
 from typing import Optional, Dict, List, Any, Union
 from datetime import datetime
 
+# Допустимый формат адреса сайта (компилируется один раз при импорте)
+_WEBSITE_RE = re.compile(r'^https?://')
+
 # Базовые схемы для локаций
 
 class LocationBase(BaseModel):
@@ -20,8 +25,7 @@ class LocationCreate(LocationBase):
     """Схема для создания локации"""
     company_id: int = Field(..., gt=0, description="ID компании")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LocationUpdate(BaseModel):
@@ -45,8 +49,7 @@ class LocationInDB(LocationBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LocationResponse(LocationInDB):
@@ -68,11 +71,12 @@ class CompanyBase(BaseModel):
     social_links: Optional[Union[Dict[str, str], str]] = Field(None, description="Социальные сети")
     city: Optional[str] = Field(None, description="Город")
 
-    @validator('website', pre=True)
+    @field_validator('website', mode='before')
+    @classmethod
     def validate_website(cls, v):
         if v is None or v == '':
             return None
-        if isinstance(v, str) and v.startswith('http'):
+        if isinstance(v, str) and _WEBSITE_RE.match(v):
             return v
         raise ValueError('Неверный формат URL. Должен начинаться с http:// или https://')
 
@@ -85,8 +89,7 @@ class CompanyCreate(CompanyBase):
     company_metadata: Optional[Dict[str, Any]] = Field(None, description="Метаданные компании")
     is_active: Optional[bool] = Field(True, description="Активна ли компания")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CompanyUpdate(BaseModel):
@@ -121,8 +124,7 @@ class CompanyInDB(CompanyBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CompanyResponse(CompanyInDB):
@@ -135,6 +137,9 @@ class CompanyDetailResponse(CompanyResponse):
     locations: List[LocationResponse] = []
     working_hours: List[Dict[str, Any]] = []
 
+    # Валидатор собирается при первом использовании, а не при импорте
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
 
 class CompanyRegistration(BaseModel):
     """Схема для регистрации компании с учетными данными пользователя"""
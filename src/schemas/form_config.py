@@ -1,6 +1,24 @@
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
+
+class FormFieldValidation(BaseModel):
+    """Правила валидации поля формы"""
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    pattern: Optional[str] = None
+    accepted_types: Optional[List[str]] = None
+    max_size: Optional[int] = None
+    
+    # Дополнительные правила, специфичные для типа поля, сохраняются как есть
+    model_config = ConfigDict(extra="allow")
+
+
+class FormFieldOption(BaseModel):
+    """Вариант выбора для поля формы"""
+    value: str
+    label: str
+
 
 class FormFieldBase(BaseModel):
     """Базовая схема поля формы"""
@@ -12,8 +30,8 @@ class FormFieldBase(BaseModel):
     help_text: Optional[str] = None
     default_value: Optional[Any] = None
     order: int = 0
-    validation: Optional[Dict[str, Any]] = None
-    options: Optional[List[Dict[str, Any]]] = None
+    validation: Optional[FormFieldValidation] = None
+    options: Optional[List[FormFieldOption]] = None
     conditional_display: Optional[Dict[str, Any]] = None
     
 class FormConfigBase(BaseModel):
@@ -46,8 +64,7 @@ class FormConfigInDB(FormConfigBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
         
 class FormConfigResponse(FormConfigInDB):
     """Схема ответа с данными конфигурации формы"""
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class LocationBase(BaseModel):
@@ -37,8 +37,7 @@ class LocationInDB(LocationBase):
     id: int
     company_id: int
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LocationResponse(LocationBase):
@@ -46,5 +45,4 @@ class LocationResponse(LocationBase):
     id: int
     company_id: int
     
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
@@ -1,10 +1,11 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ConfigDict
 
 
-class ModerationStatusEnum:
+class ModerationStatusEnum(str, Enum):
     """Статусы модерации"""
     PENDING = "на рассмотрении"
     APPROVED = "одобрено"
@@ -14,15 +15,9 @@ class ModerationStatusEnum:
 
 class ModerationRecordBase(BaseModel):
     """Базовая схема записи модерации"""
-    status: str = Field(default=ModerationStatusEnum.PENDING)
+    status: ModerationStatusEnum = Field(default=ModerationStatusEnum.PENDING)
     moderation_notes: Optional[str] = None
 
-    @field_validator("status")
-    def validate_status(cls, v):
-        if v not in [status for status in vars(ModerationStatusEnum).values() if not status.startswith("_")]:
-            raise ValueError(f"Некорректный статус модерации. Допустимые значения: {', '.join([s for s in vars(ModerationStatusEnum).values() if not s.startswith('_')])}")
-        return v
-
 
 class ModerationRecordCreate(BaseModel):
     """Схема создания записи модерации"""
@@ -32,14 +27,8 @@ class ModerationRecordCreate(BaseModel):
 
 class ModerationUpdate(BaseModel):
     """Схема обновления статуса модерации"""
-    status: str
+    status: ModerationStatusEnum
     moderation_notes: Optional[str] = None
-    
-    @field_validator("status")
-    def validate_status(cls, v):
-        if v not in [status for status in vars(ModerationStatusEnum).values() if not status.startswith("_")]:
-            raise ValueError(f"Некорректный статус модерации. Допустимые значения: {', '.join([s for s in vars(ModerationStatusEnum).values() if not s.startswith('_')])}")
-        return v
 
 
 class ModerationRecordInDB(ModerationRecordBase):
@@ -51,8 +40,7 @@ class ModerationRecordInDB(ModerationRecordBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ModerationRecordResponse(ModerationRecordBase):
@@ -64,8 +52,7 @@ class ModerationRecordResponse(ModerationRecordBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AutoCheckResult(BaseModel):
@@ -1,9 +1,9 @@
 """
 Схемы данных для уведомлений
 """
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class NotificationBase(BaseModel):
@@ -32,5 +32,8 @@ class NotificationResponse(NotificationBase):
     read: bool = Field(..., description="Прочитано ли уведомление")
     created_at: datetime = Field(..., description="Дата и время создания")
     
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Список уведомлений проверяется и сериализуется одним вызовом pydantic-core
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationResponse])
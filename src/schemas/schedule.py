@@ -1,80 +1,95 @@
-from datetime import datetime, time
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, validator, Field
+from datetime import datetime, time, date
+from typing import Optional, List, Dict, Any, Tuple, Union, Annotated
+from pydantic import BaseModel, BeforeValidator, PlainSerializer, ConfigDict, computed_field, field_validator, model_serializer, TypeAdapter
+
+
+def _parse_hour_minute(v: Any) -> Any:
+    """Разбирает строку времени строго в формате HH:MM"""
+    if isinstance(v, str):
+        try:
+            return datetime.strptime(v, '%H:%M').time()
+        except ValueError:
+            raise ValueError('Время должно быть в формате HH:MM')
+    return v
+
+
+# Время дня: принимается и сохраняется в JSON в формате HH:MM
+HourMinute = Annotated[
+    time,
+    BeforeValidator(_parse_hour_minute),
+    PlainSerializer(lambda v: v.strftime('%H:%M'), return_type=str, when_used='json'),
+]
+
+# Дни недели в порядке date.weekday() (0 - понедельник)
+WEEKDAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# Допустимые дни недели для повторяющихся событий
+_VALID_DAYS = frozenset(WEEKDAY_NAMES)
 
 # Схемы для работы с расписанием
 
 class WeeklyScheduleItem(BaseModel):
     """Схема для одного дня недели в расписании"""
-    start: str
-    end: str
+    start: HourMinute
+    end: HourMinute
     is_working_day: bool = True
 
-    @validator('start', 'end')
-    def validate_time_format(cls, v):
-        try:
-            datetime.strptime(v, '%H:%M')
-        except ValueError:
-            raise ValueError('Время должно быть в формате HH:MM')
-        return v
+class WeeklySchedule(BaseModel):
+    """Недельное расписание: по одному необязательному элементу на каждый день"""
+    monday: Optional[WeeklyScheduleItem] = None
+    tuesday: Optional[WeeklyScheduleItem] = None
+    wednesday: Optional[WeeklyScheduleItem] = None
+    thursday: Optional[WeeklyScheduleItem] = None
+    friday: Optional[WeeklyScheduleItem] = None
+    saturday: Optional[WeeklyScheduleItem] = None
+    sunday: Optional[WeeklyScheduleItem] = None
+
+    model_config = ConfigDict(extra='forbid')
+
+    @model_serializer(mode='wrap')
+    def _skip_missing_days(self, handler):
+        # Не указанные дни не попадают в JSON, как и в прежнем словаре по дням
+        return {day: item for day, item in handler(self).items() if item is not None}
+
+    def as_arrays(self) -> Tuple[Tuple[Optional[time], ...], Tuple[Optional[time], ...], Tuple[bool, ...]]:
+        """
+        Разложить расписание на три кортежа по 7 элементов, индексируемых date.weekday()
+
+        Returns:
+            Время начала, время окончания и признак рабочего дня; для не указанного
+            дня время равно None, а день считается нерабочим
+        """
+        days = (self.monday, self.tuesday, self.wednesday, self.thursday,
+                self.friday, self.saturday, self.sunday)
+        return (
+            tuple(day.start if day else None for day in days),
+            tuple(day.end if day else None for day in days),
+            tuple(day.is_working_day if day else False for day in days),
+        )
 
 class ExceptionScheduleItem(BaseModel):
     """Схема для исключения (особого дня) в расписании"""
-    date: str
-    start: Optional[str] = None
-    end: Optional[str] = None
+    date: date
+    start: Optional[HourMinute] = None
+    end: Optional[HourMinute] = None
     is_working_day: bool = True
 
-    @validator('date')
-    def validate_date_format(cls, v):
-        try:
-            datetime.strptime(v, '%Y-%m-%d')
-        except ValueError:
-            raise ValueError('Дата должна быть в формате YYYY-MM-DD')
-        return v
-
-    @validator('start', 'end')
-    def validate_time_format(cls, v):
-        if v is not None:
-            try:
-                datetime.strptime(v, '%H:%M')
-            except ValueError:
-                raise ValueError('Время должно быть в формате HH:MM')
-        return v
-
 class RecurringEventItem(BaseModel):
     """Схема для повторяющегося события в расписании"""
     name: str
-    start_time: str
-    end_time: str
+    start_time: HourMinute
+    end_time: HourMinute
     days: List[str]
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
     is_working_time: bool = False
 
-    @validator('days')
+    @field_validator('days')
+    @classmethod
     def validate_days(cls, v):
-        valid_days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        for day in v:
-            if day not in valid_days:
-                raise ValueError(f"Некорректный день недели: {day}")
-        return v
-
-    @validator('start_time', 'end_time')
-    def validate_time_format(cls, v):
-        try:
-            datetime.strptime(v, '%H:%M')
-        except ValueError:
-            raise ValueError('Время должно быть в формате HH:MM')
-        return v
-
-    @validator('start_date', 'end_date')
-    def validate_date_format(cls, v):
-        if v is not None:
-            try:
-                datetime.strptime(v, '%Y-%m-%d')
-            except ValueError:
-                raise ValueError('Дата должна быть в формате YYYY-MM-DD')
+        if not _VALID_DAYS.issuperset(v):
+            bad_day = next(day for day in v if day not in _VALID_DAYS)
+            raise ValueError(f"Некорректный день недели: {bad_day}")
         return v
 
 class ScheduleBase(BaseModel):
@@ -83,7 +98,7 @@ class ScheduleBase(BaseModel):
     service_id: Optional[int] = None
     schedule_type: str = "service"
     name: str
-    weekly_schedule: Dict[str, WeeklyScheduleItem]
+    weekly_schedule: WeeklySchedule
     exceptions: Optional[List[ExceptionScheduleItem]] = None
     recurring_events: Optional[List[RecurringEventItem]] = None
     slot_duration: int = 60
@@ -100,7 +115,7 @@ class ScheduleUpdate(BaseModel):
     service_id: Optional[int] = None
     schedule_type: Optional[str] = None
     name: Optional[str] = None
-    weekly_schedule: Optional[Dict[str, WeeklyScheduleItem]] = None
+    weekly_schedule: Optional[WeeklySchedule] = None
     exceptions: Optional[List[ExceptionScheduleItem]] = None
     recurring_events: Optional[List[RecurringEventItem]] = None
     slot_duration: Optional[int] = None
@@ -114,8 +129,7 @@ class ScheduleInDB(ScheduleBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ScheduleResponse(ScheduleInDB):
     """Схема ответа с данными расписания"""
@@ -147,36 +161,27 @@ class TimeSlotInDB(TimeSlotBase):
     id: int
     current_bookings: int = 0
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TimeSlotResponse(TimeSlotInDB):
     """Схема ответа с данными временного слота"""
-    available_spots: int = Field(..., description="Количество доступных мест")
+    @computed_field(description="Количество доступных мест")
+    @property
+    def available_spots(self) -> int:
+        return max(0, self.max_bookings - self.current_bookings)
 
-    @validator('available_spots', pre=True, always=True)
-    def calculate_available_spots(cls, v, values):
-        max_bookings = values.get('max_bookings', 0)
-        current_bookings = values.get('current_bookings', 0)
-        return max(0, max_bookings - current_bookings)
+# Список слотов проверяется и сериализуется одним вызовом pydantic-core
+TIME_SLOT_LIST_ADAPTER = TypeAdapter(List[TimeSlotResponse])
 
 # Схемы для генерации временных слотов
 
 class GenerateSlotsRequest(BaseModel):
     """Схема запроса на генерацию временных слотов"""
     schedule_id: int
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
     override_existing: bool = False
 
-    @validator('start_date', 'end_date')
-    def validate_date_format(cls, v):
-        try:
-            datetime.strptime(v, '%Y-%m-%d')
-        except ValueError:
-            raise ValueError('Дата должна быть в формате YYYY-MM-DD')
-        return v
-
 class GenerateSlotsResponse(BaseModel):
     """Схема ответа на генерацию временных слотов"""
     success: bool
@@ -1,26 +1,30 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
+
+from src.schemas.types import Name255, String100, String255
 
 
 class ServiceBase(BaseModel):
     """Базовая схема услуги"""
-    name: str = Field(..., min_length=1, max_length=255, description="Название услуги")
+    name: Name255 = Field(..., description="Название услуги")
     description: Optional[str] = Field(None, description="Описание услуги")
     price: float = Field(0.0, ge=0, description="Стоимость услуги")
     duration: int = Field(60, ge=5, description="Длительность услуги в минутах")
     is_active: bool = Field(True, description="Активна ли услуга")
-    category: Optional[str] = Field(None, max_length=100, description="Категория услуги")
-    tags: Optional[str] = Field(None, max_length=255, description="Теги услуги")
+    category: Optional[String100] = Field(None, description="Категория услуги")
+    tags: Optional[String255] = Field(None, description="Теги услуги")
     
-    @validator("price")
+    @field_validator("price")
+    @classmethod
     def validate_price(cls, v):
         if v < 0:
             raise ValueError("Цена не может быть отрицательной")
         return v
     
-    @validator("duration")
+    @field_validator("duration")
+    @classmethod
     def validate_duration(cls, v):
         if v <= 0:
             raise ValueError("Длительность должна быть положительной")
@@ -32,28 +36,29 @@ class ServiceCreate(ServiceBase):
     company_id: int = Field(..., gt=0, description="ID компании")
     additional_params: Optional[Dict[str, Any]] = Field(None, description="Дополнительные параметры")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ServiceUpdate(BaseModel):
     """Схема обновления услуги"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255, description="Название услуги")
+    name: Optional[Name255] = Field(None, description="Название услуги")
     description: Optional[str] = Field(None, description="Описание услуги")
     price: Optional[float] = Field(None, ge=0, description="Стоимость услуги")
     duration: Optional[int] = Field(None, ge=5, description="Длительность услуги в минутах")
     is_active: Optional[bool] = Field(None, description="Активна ли услуга")
-    category: Optional[str] = Field(None, max_length=100, description="Категория услуги")
-    tags: Optional[str] = Field(None, max_length=255, description="Теги услуги")
+    category: Optional[String100] = Field(None, description="Категория услуги")
+    tags: Optional[String255] = Field(None, description="Теги услуги")
     additional_params: Optional[Dict[str, Any]] = Field(None, description="Дополнительные параметры")
     
-    @validator("price")
+    @field_validator("price")
+    @classmethod
     def validate_price(cls, v):
         if v is not None and v < 0:
             raise ValueError("Цена не может быть отрицательной")
         return v
     
-    @validator("duration")
+    @field_validator("duration")
+    @classmethod
     def validate_duration(cls, v):
         if v is not None and v <= 0:
             raise ValueError("Длительность должна быть положительной")
@@ -68,8 +73,7 @@ class ServiceInDB(ServiceBase):
     updated_at: datetime
     additional_params: Optional[Dict[str, Any]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ServiceResponse(ServiceInDB):
@@ -81,8 +85,7 @@ class ServiceDetailResponse(ServiceResponse):
     """Расширенная схема услуги с дополнительными данными"""
     company_name: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ServiceListResponse(BaseModel):
@@ -90,4 +93,8 @@ class ServiceListResponse(BaseModel):
     items: List[ServiceResponse]
     total: int
     page: int
-    size: int 
\ No newline at end of file
+    size: int
+
+
+# Список услуг проверяется и сериализуется одним вызовом pydantic-core
+SERVICE_LIST_ADAPTER = TypeAdapter(List[ServiceResponse])
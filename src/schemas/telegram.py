@@ -0,0 +1,33 @@
+"""
+Схемы данных для обновлений Telegram Bot API
+"""
+from typing import Optional
+from pydantic import BaseModel
+
+
+class TelegramChat(BaseModel):
+    """Чат, из которого пришло обновление"""
+    id: int
+
+
+class TelegramMessage(BaseModel):
+    """Сообщение пользователя"""
+    chat: TelegramChat
+    text: Optional[str] = None
+
+
+class TelegramCallbackQuery(BaseModel):
+    """Нажатие inline-кнопки"""
+    id: str
+    message: Optional[TelegramMessage] = None
+    data: Optional[str] = None
+
+
+class TelegramUpdate(BaseModel):
+    """
+    Обновление от Telegram
+
+    Разбираются только используемые поля, остальные игнорируются.
+    """
+    message: Optional[TelegramMessage] = None
+    callback_query: Optional[TelegramCallbackQuery] = None
@@ -0,0 +1,13 @@
+"""
+Общие типы полей для схем
+"""
+from typing import Annotated
+
+from pydantic import Field
+
+# Строки с ограничением длины, которые повторяются в нескольких схемах.
+# Ограничения объявлены один раз и переиспользуются всеми полями.
+String100 = Annotated[str, Field(max_length=100)]
+String255 = Annotated[str, Field(max_length=255)]
+Name255 = Annotated[str, Field(min_length=1, max_length=255)]
+Phone20 = Annotated[str, Field(max_length=20)]
@@ -1,49 +1,57 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator, model_validator
 
 from src.models.user import UserRole
+from src.schemas.types import Phone20, String100
+
+# Допустимые роли и сообщение об ошибке вычисляются один раз при импорте
+_USER_ROLE_VALUES = frozenset(role.value for role in UserRole)
+_USER_ROLE_VALUES_MSG = ", ".join(role.value for role in UserRole)
 
 
 class UserBase(BaseModel):
     """Базовая схема пользователя"""
-    email: EmailStr = Field(..., description="Email пользователя")
-    phone: Optional[str] = Field(None, max_length=20, description="Телефон пользователя")
-    first_name: Optional[str] = Field(None, max_length=100, description="Имя пользователя")
-    last_name: Optional[str] = Field(None, max_length=100, description="Фамилия пользователя")
+    # Email из БД уже проверен при регистрации, строгая проверка только во входных схемах
+    email: str = Field(..., description="Email пользователя")
+    phone: Optional[Phone20] = Field(None, description="Телефон пользователя")
+    first_name: Optional[String100] = Field(None, description="Имя пользователя")
+    last_name: Optional[String100] = Field(None, description="Фамилия пользователя")
     role: UserRole = Field(UserRole.CLIENT, description="Роль пользователя")
     avatar: Optional[str] = Field(None, description="URL аватара")
 
 
 class UserCreate(UserBase):
     """Схема создания пользователя"""
+    email: EmailStr = Field(..., description="Email пользователя")
     password: str = Field(..., min_length=8, description="Пароль пользователя")
     password_confirm: str = Field(..., min_length=8, description="Подтверждение пароля")
     is_active: Optional[bool] = Field(True, description="Активен ли пользователь")
     is_superuser: Optional[bool] = Field(False, description="Является ли суперпользователем")
     
-    @validator("password_confirm")
-    def passwords_match(cls, v, values, **kwargs):
-        if "password" in values and v != values["password"]:
+    @model_validator(mode="after")
+    def _check_passwords(self):
+        if self.password != self.password_confirm:
             raise ValueError("Пароли не совпадают")
-        return v
+        return self
 
 
 class UserUpdate(BaseModel):
     """Схема обновления пользователя"""
     email: Optional[EmailStr] = Field(None, description="Email пользователя")
-    phone: Optional[str] = Field(None, max_length=20, description="Телефон пользователя")
-    first_name: Optional[str] = Field(None, max_length=100, description="Имя пользователя")
-    last_name: Optional[str] = Field(None, max_length=100, description="Фамилия пользователя")
+    phone: Optional[Phone20] = Field(None, description="Телефон пользователя")
+    first_name: Optional[String100] = Field(None, description="Имя пользователя")
+    last_name: Optional[String100] = Field(None, description="Фамилия пользователя")
     avatar: Optional[str] = Field(None, description="URL аватара")
     role: Optional[str] = Field(None, description="Роль пользователя")
     is_active: Optional[bool] = Field(None, description="Активен ли пользователь")
     
-    @validator("role")
+    @field_validator("role")
+    @classmethod
     def validate_role(cls, v):
-        if v is not None and v not in [role.value for role in UserRole]:
-            raise ValueError(f"Недопустимая роль. Должна быть одна из: {', '.join([role.value for role in UserRole])}")
+        if v is not None and v not in _USER_ROLE_VALUES:
+            raise ValueError(f"Недопустимая роль. Должна быть одна из: {_USER_ROLE_VALUES_MSG}")
         return v
 
 
@@ -55,8 +63,7 @@ class UserInDB(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserResponse(UserBase):
@@ -66,8 +73,7 @@ class UserResponse(UserBase):
     is_superuser: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserDetailResponse(UserResponse):
@@ -76,8 +82,7 @@ class UserDetailResponse(UserResponse):
     bookings: List[Dict[str, Any]] = []
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LoginRequest(BaseModel):
@@ -92,11 +97,11 @@ class PasswordChange(BaseModel):
     new_password: str = Field(..., min_length=8, description="Новый пароль")
     confirm_password: str = Field(..., description="Подтверждение нового пароля")
     
-    @validator("confirm_password")
-    def passwords_match(cls, v, values, **kwargs):
-        if "new_password" in values and v != values["new_password"]:
+    @model_validator(mode="after")
+    def _check_passwords(self):
+        if self.new_password != self.confirm_password:
             raise ValueError("Пароли не совпадают")
-        return v
+        return self
 
 
 class TokenData(BaseModel):
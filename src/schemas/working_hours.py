@@ -1,30 +1,27 @@
 from datetime import time
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from src.adapters.database.models.working_hours import DayOfWeek
 
 
 class WorkingHoursBase(BaseModel):
     """Базовая схема рабочих часов"""
-    day: str
+    day: DayOfWeek
     open_time: Optional[time] = None
     close_time: Optional[time] = None
     is_working_day: bool = True
     
-    @field_validator("day")
-    def validate_day(cls, v):
-        if v not in [day.value for day in DayOfWeek]:
-            raise ValueError(f"Invalid day. Must be one of: {', '.join([day.value for day in DayOfWeek])}")
-        return v
+    # День недели проверяется валидатором перечисления, в модели хранится строка
+    model_config = ConfigDict(use_enum_values=True)
     
-    @field_validator("open_time", "close_time")
-    def validate_time(cls, v, values):
+    @model_validator(mode="after")
+    def validate_time(self):
         # Если это рабочий день, время должно быть указано
-        if "is_working_day" in values and values["is_working_day"] and v is None:
+        if self.is_working_day and (self.open_time is None or self.close_time is None):
             raise ValueError("Time must be specified for working days")
-        return v
+        return self
 
 
 class WorkingHoursCreate(WorkingHoursBase):
@@ -44,8 +41,7 @@ class WorkingHoursInDB(WorkingHoursBase):
     id: int
     company_id: int
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WorkingHoursResponse(WorkingHoursBase):
@@ -53,5 +49,4 @@ class WorkingHoursResponse(WorkingHoursBase):
     id: int
     company_id: int
     
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
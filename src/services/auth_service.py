@@ -1,23 +1,85 @@
 """
 Сервис аутентификации пользователей
 """
-from datetime import datetime, timedelta
-from typing import Optional, Any, Union, Dict
+import time
+from datetime import timedelta
+from typing import Optional, Any, Union, Dict, Hashable
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db_adapter import get_db
 from src.core.config import settings
+from src.models.user import User, UserRole
 from src.repositories.user import UserRepository
 from src.schemas.user import TokenData, UserResponse
 
 
+def user_response_from_orm(user: User) -> UserResponse:
+    """
+    Собрать UserResponse из строки БД без повторной валидации
+    
+    Данные пользователя из базы уже проверены при записи, поэтому
+    используется model_construct вместо model_validate.
+    
+    Args:
+        user: Объект пользователя из БД
+        
+    Returns:
+        Схема пользователя
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        phone=user.phone,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        role=UserRole(user.role),
+        avatar=user.avatar,
+        is_active=user.is_active,
+        is_superuser=user.is_superuser,
+        created_at=user.created_at,
+    )
+
+
 # Oauth2 схема для получения токена из заголовка
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/token")
 
+# Параметры JWT читаются из настроек один раз при импорте
+_JWT_SECRET = str(settings.JWT_SECRET_KEY)
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGS = [_JWT_ALGORITHM]
+_JWT_TOKEN_TTL = timedelta(minutes=settings.JWT_TOKEN_LIFETIME)
+
+# Роли с доступом к бизнес-разделу
+_BUSINESS_ROLES = frozenset(("business", "admin", "owner", "manager"))
+
+# Кэш проверенных токенов: ключ с токеном -> (момент истечения токена, пользователь).
+# Повторный запрос с тем же токеном не декодирует JWT и не обращается к БД;
+# изменения пользователя (например, блокировка) видны не позже чем через ttl секунд.
+_token_user_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _get_cached_user(key: Hashable) -> Optional[UserResponse]:
+    """Пользователь из кэша токенов, если запись есть и токен еще не истек"""
+    cached = _token_user_cache.get(key)
+    if cached is None:
+        return None
+    expires_at, user = cached
+    if expires_at <= time.time():
+        _token_user_cache.pop(key, None)
+        return None
+    return user
+
+
+def _cache_user(key: Hashable, payload: Dict[str, Any], user: UserResponse) -> None:
+    """Сохранить пользователя в кэше токенов не дольше срока действия токена"""
+    _token_user_cache[key] = (payload.get("exp", float("inf")), user)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -31,12 +93,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         Закодированный JWT-токен
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_TOKEN_LIFETIME)
+    # exp записывается сразу в секундах Unix, без преобразования datetime при кодировании
+    expire = int(time.time() + (expires_delta or _JWT_TOKEN_TTL).total_seconds())
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, str(settings.JWT_SECRET_KEY), algorithm=settings.JWT_ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -54,6 +114,11 @@ async def verify_token(token: str, db: AsyncSession) -> UserResponse:
     Raises:
         HTTPException: Если токен невалидный или пользователь не найден
     """
+    cache_key = ("id", token)
+    cached_user = _get_cached_user(cache_key)
+    if cached_user is not None:
+        return cached_user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Невалидные учетные данные",
@@ -61,11 +126,7 @@ async def verify_token(token: str, db: AsyncSession) -> UserResponse:
     )
     
     try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET_KEY, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS)
         user_id = payload.get("sub")
         if user_id is None:
             raise credentials_exception
@@ -85,7 +146,9 @@ async def verify_token(token: str, db: AsyncSession) -> UserResponse:
             detail="Пользователь неактивен"
         )
     
-    return user
+    user_response = user_response_from_orm(user)
+    _cache_user(cache_key, payload, user_response)
+    return user_response
 
 
 async def get_current_user(
@@ -105,6 +168,11 @@ async def get_current_user(
     Raises:
         HTTPException: Если токен недействителен или пользователь не найден
     """
+    cache_key = ("email", token)
+    cached_user = _get_cached_user(cache_key)
+    if cached_user is not None:
+        return cached_user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Невозможно проверить учетные данные",
@@ -112,11 +180,7 @@ async def get_current_user(
     )
     
     try:
-        payload = jwt.decode(
-            token, 
-            str(settings.JWT_SECRET_KEY), 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -129,7 +193,9 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
     
-    return user
+    user_response = user_response_from_orm(user)
+    _cache_user(cache_key, payload, user_response)
+    return user_response
 
 
 async def get_current_active_business_user(
@@ -147,7 +213,7 @@ async def get_current_active_business_user(
     Raises:
         HTTPException: Если пользователь не является бизнес-пользователем
     """
-    if current_user.role not in ["business", "admin", "owner", "manager"]:
+    if current_user.role not in _BUSINESS_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Недостаточно прав. Требуется бизнес-аккаунт"
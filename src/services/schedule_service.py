@@ -1,10 +1,64 @@
-from datetime import datetime, timedelta, time
-from typing import Dict, List, Optional, Any, Union
-from sqlalchemy import select, and_, or_, func
+from datetime import date, datetime, timedelta, time
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
+from sqlalchemy import RowMapping, select, update, delete, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.booking import Booking
 from src.models.schedule import Schedule, TimeSlot
-from src.schemas.schedule import ScheduleCreate, ScheduleUpdate, TimeSlotCreate, TimeSlotUpdate
+from src.schemas.schedule import ScheduleCreate, ScheduleUpdate, TimeSlotCreate, TimeSlotUpdate, WEEKDAY_NAMES
+
+# Размер порции строк при пакетной вставке сгенерированных слотов
+TIME_SLOTS_INSERT_BATCH = 5000
+
+# Колонки уникального индекса ix_timeslot_schedule_start_end для ON CONFLICT
+_TIME_SLOT_CONFLICT_COLUMNS = ("schedule_id", "start_time", "end_time")
+
+# Номер дня недели (как в date.weekday()) по его названию
+_WEEKDAY_NUMBERS = {name: number for number, name in enumerate(WEEKDAY_NAMES)}
+
+
+@lru_cache(maxsize=1024)
+def _parse_hour_minute(value: str) -> Tuple[int, int]:
+    """Разобрать строку HH:MM в пару (часы, минуты); каждая строка разбирается один раз"""
+    hour, minute = value.split(":")
+    return int(hour), int(minute)
+
+
+@lru_cache(maxsize=256)
+def _day_slot_offsets(
+    start_time_str: str,
+    end_time_str: str,
+    slot_duration: int,
+    slot_interval: int
+) -> Tuple[Tuple[timedelta, timedelta], ...]:
+    """
+    Смещения начала и конца слотов от полуночи для рабочего дня
+    
+    Результат зависит только от часов работы и настроек слотов, поэтому
+    вычисляется один раз для всех дней с одинаковым расписанием.
+    
+    Args:
+        start_time_str: Начало рабочего дня в формате HH:MM
+        end_time_str: Конец рабочего дня в формате HH:MM
+        slot_duration: Длительность слота в минутах
+        slot_interval: Перерыв между слотами в минутах
+        
+    Returns:
+        Кортеж пар (смещение начала, смещение конца)
+    """
+    start_hour, start_minute = _parse_hour_minute(start_time_str)
+    end_hour, end_minute = _parse_hour_minute(end_time_str)
+    day_start = start_hour * 60 + start_minute
+    day_end = end_hour * 60 + end_minute
+    
+    offsets = []
+    slot_start = day_start
+    while slot_start + slot_duration <= day_end:
+        offsets.append((timedelta(minutes=slot_start), timedelta(minutes=slot_start + slot_duration)))
+        slot_start += slot_duration + slot_interval
+    return tuple(offsets)
 
 class ScheduleService:
     """Сервис для работы с расписаниями и временными слотами"""
@@ -16,14 +70,18 @@ class ScheduleService:
     
     async def create_schedule(self, schedule_data: ScheduleCreate) -> Schedule:
         """Создать новое расписание"""
+        # Вложенные элементы сохраняются в JSON со строками HH:MM и YYYY-MM-DD
+        json_data = schedule_data.model_dump(
+            mode="json", include={"weekly_schedule", "exceptions", "recurring_events"}
+        )
         new_schedule = Schedule(
             company_id=schedule_data.company_id,
             service_id=schedule_data.service_id,
             schedule_type=schedule_data.schedule_type,
             name=schedule_data.name,
-            weekly_schedule=schedule_data.weekly_schedule,
-            exceptions=schedule_data.exceptions,
-            recurring_events=schedule_data.recurring_events,
+            weekly_schedule=json_data["weekly_schedule"],
+            exceptions=json_data["exceptions"],
+            recurring_events=json_data["recurring_events"],
             slot_duration=schedule_data.slot_duration,
             slot_interval=schedule_data.slot_interval,
             max_concurrent_bookings=schedule_data.max_concurrent_bookings,
@@ -31,28 +89,43 @@ class ScheduleService:
         )
         
         self.db.add(new_schedule)
+        # id и значения по умолчанию заполняются при flush (INSERT ... RETURNING),
+        # а сессия не сбрасывает атрибуты при commit, поэтому refresh не нужен
         await self.db.commit()
-        await self.db.refresh(new_schedule)
         return new_schedule
     
     async def get_schedule(self, schedule_id: int) -> Optional[Schedule]:
         """Получить расписание по ID"""
-        query = select(Schedule).where(Schedule.id == schedule_id)
-        result = await self.db.execute(query)
-        return result.scalars().first()
+        # session.get сначала проверяет identity map и не делает SELECT,
+        # если расписание уже загружено в этой сессии
+        return await self.db.get(Schedule, schedule_id)
     
     async def list_schedules(
         self, 
         company_id: int, 
-        service_id: Optional[int] = None
-    ) -> List[Schedule]:
-        """Получить список расписаний для компании или услуги"""
-        query = select(Schedule).where(Schedule.company_id == company_id)
+        service_id: Optional[int] = None,
+        core: bool = False
+    ) -> Union[List[Schedule], List[RowMapping]]:
+        """
+        Получить список расписаний для компании или услуги
+        
+        Args:
+            company_id: ID компании
+            service_id: ID услуги (опционально)
+            core: Вернуть строки таблицы как словари без создания ORM-объектов
+            
+        Returns:
+            Список расписаний
+        """
+        # Для core-запроса строки читаются из таблицы напрямую, минуя identity map
+        query = select(Schedule.__table__ if core else Schedule).where(Schedule.company_id == company_id)
         
         if service_id is not None:
             query = query.where(Schedule.service_id == service_id)
         
         result = await self.db.execute(query)
+        if core:
+            return list(result.mappings().all())
         return list(result.scalars().all())
     
     async def update_schedule(
@@ -61,33 +134,38 @@ class ScheduleService:
         schedule_update: ScheduleUpdate
     ) -> Optional[Schedule]:
         """Обновить существующее расписание"""
-        schedule = await self.get_schedule(schedule_id)
-        if not schedule:
+        update_data = schedule_update.model_dump(mode="json", exclude_unset=True)
+        if not update_data:
+            return await self.get_schedule(schedule_id)
+        
+        # Один UPDATE ... RETURNING только по переданным полям вместо SELECT + UPDATE + refresh
+        query = (
+            update(Schedule)
+            .where(Schedule.id == schedule_id)
+            .values(**update_data)
+            .returning(Schedule)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        schedule = result.scalar_one_or_none()
+        if schedule is None:
             return None
         
-        update_data = schedule_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(schedule, key, value)
-        
         await self.db.commit()
-        await self.db.refresh(schedule)
         return schedule
     
     async def delete_schedule(self, schedule_id: int) -> bool:
         """Удалить расписание"""
-        schedule = await self.get_schedule(schedule_id)
-        if not schedule:
-            return False
-        
         # Удаляем связанные временные слоты
-        query = select(TimeSlot).where(TimeSlot.schedule_id == schedule_id)
-        result = await self.db.execute(query)
-        timeslots = result.scalars().all()
+        await self._delete_slots_where(TimeSlot.schedule_id == schedule_id)
         
-        for timeslot in timeslots:
-            await self.db.delete(timeslot)
+        # DELETE ... RETURNING заодно проверяет, существовало ли расписание
+        result = await self.db.execute(
+            delete(Schedule).where(Schedule.id == schedule_id).returning(Schedule.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
         
-        await self.db.delete(schedule)
         await self.db.commit()
         return True
     
@@ -105,31 +183,36 @@ class ScheduleService:
         )
         
         self.db.add(new_timeslot)
+        # id и значения по умолчанию заполняются при flush (INSERT ... RETURNING),
+        # а сессия не сбрасывает атрибуты при commit, поэтому refresh не нужен
         await self.db.commit()
-        await self.db.refresh(new_timeslot)
         return new_timeslot
     
     async def get_timeslot(self, timeslot_id: int) -> Optional[TimeSlot]:
         """Получить временной слот по ID"""
-        query = select(TimeSlot).where(TimeSlot.id == timeslot_id)
-        result = await self.db.execute(query)
-        return result.scalars().first()
+        return await self.db.get(TimeSlot, timeslot_id)
     
     async def list_timeslots(
         self, 
         schedule_id: int,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        is_available: Optional[bool] = None
-    ) -> List[TimeSlot]:
-        """Получить список временных слотов для расписания с фильтрацией"""
-        query = select(TimeSlot).where(TimeSlot.schedule_id == schedule_id)
+        is_available: Optional[bool] = None,
+        core: bool = False
+    ) -> Union[List[TimeSlot], List[RowMapping]]:
+        """
+        Получить список временных слотов для расписания с фильтрацией
+        
+        Слоты отбираются по полуоткрытому интервалу start_time <= начало < end_time.
+        При core=True возвращаются строки таблицы как словари без создания ORM-объектов.
+        """
+        query = select(TimeSlot.__table__ if core else TimeSlot).where(TimeSlot.schedule_id == schedule_id)
         
         if start_time:
             query = query.where(TimeSlot.start_time >= start_time)
         
         if end_time:
-            query = query.where(TimeSlot.start_time <= end_time)
+            query = query.where(TimeSlot.start_time < end_time)
         
         if is_available is not None:
             query = query.where(TimeSlot.is_available == is_available)
@@ -138,6 +221,8 @@ class ScheduleService:
         query = query.order_by(TimeSlot.start_time)
         
         result = await self.db.execute(query)
+        if core:
+            return list(result.mappings().all())
         return list(result.scalars().all())
     
     async def update_timeslot(
@@ -146,25 +231,34 @@ class ScheduleService:
         timeslot_update: TimeSlotUpdate
     ) -> Optional[TimeSlot]:
         """Обновить существующий временной слот"""
-        timeslot = await self.get_timeslot(timeslot_id)
-        if not timeslot:
+        update_data = timeslot_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_timeslot(timeslot_id)
+        
+        # Один UPDATE ... RETURNING только по переданным полям вместо SELECT + UPDATE + refresh
+        query = (
+            update(TimeSlot)
+            .where(TimeSlot.id == timeslot_id)
+            .values(**update_data)
+            .returning(TimeSlot)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        timeslot = result.scalar_one_or_none()
+        if timeslot is None:
             return None
         
-        update_data = timeslot_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(timeslot, key, value)
-        
         await self.db.commit()
-        await self.db.refresh(timeslot)
         return timeslot
     
     async def delete_timeslot(self, timeslot_id: int) -> bool:
         """Удалить временной слот"""
-        timeslot = await self.get_timeslot(timeslot_id)
-        if not timeslot:
+        # Удаление без предварительного SELECT: число удаленных строк
+        # показывает, существовал ли слот
+        deleted = await self._delete_slots_where(TimeSlot.id == timeslot_id)
+        if not deleted:
             return False
         
-        await self.db.delete(timeslot)
         await self.db.commit()
         return True
     
@@ -186,92 +280,76 @@ class ScheduleService:
         if override_existing:
             await self._delete_existing_slots(schedule_id, start_date, end_date)
         
-        # Инициализация счетчиков для результата
-        created_count = 0
-        skipped_count = 0
-        
-        # Проходим по каждому дню в указанном диапазоне
-        current_date = start_date
-        while current_date <= end_date:
-            # Получаем день недели (0 - понедельник, 6 - воскресенье)
-            weekday = current_date.weekday()
-            weekday_name = self._get_weekday_name(weekday)
+        # Строки новых слотов накапливаются и вставляются пакетами после генерации;
+        # уже существующие слоты отсеивает сама БД по уникальному индексу
+        slots_to_insert: List[Dict[str, Any]] = []
+        
+        # Исключения индексируются по дате один раз вместо перебора списка на каждый день;
+        # обход в обратном порядке сохраняет приоритет первого исключения на дату
+        exceptions_by_date = {
+            exception["date"]: exception
+            for exception in reversed(schedule.exceptions or [])
+            if exception.get("date")
+        }
+        
+        # Недельное расписание из JSON-колонки разбирается один раз: по номеру дня
+        # недели хранится пара (начало, конец) или None, если день нерабочий
+        weekly_schedule = schedule.weekly_schedule or {}
+        weekly_hours = tuple(
+            (day_schedule.get("start"), day_schedule.get("end"))
+            if day_schedule is not None and day_schedule.get("is_working_day", True) else None
+            for day_schedule in (weekly_schedule.get(name) for name in WEEKDAY_NAMES)
+        )
+        
+        # Проходим по каждому дню в указанном диапазоне; дни перебираются как date,
+        # datetime собирается только для самих слотов
+        for day_ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            current_date = date.fromordinal(day_ordinal)
             
-            # Проверяем, есть ли этот день в еженедельном расписании
-            if weekday_name in schedule.weekly_schedule:
-                day_schedule = schedule.weekly_schedule[weekday_name]
-                
-                # Проверяем, является ли день рабочим
-                if day_schedule.get("is_working_day", True):
-                    # Проверяем наличие исключений для этой даты
-                    exception = self._find_exception_for_date(schedule, current_date)
-                    
-                    if exception and not exception.get("is_working_day", True):
-                        # Если это исключение и день не рабочий, пропускаем
-                        current_date += timedelta(days=1)
-                        continue
-                    
-                    # Определяем время начала и окончания работы
-                    start_time_str = exception.get("start", day_schedule.get("start")) if exception else day_schedule.get("start")
-                    end_time_str = exception.get("end", day_schedule.get("end")) if exception else day_schedule.get("end")
-                    
-                    if start_time_str and end_time_str:
-                        # Создаем временные слоты для этого дня
-                        day_slots_result = await self._create_day_slots(
-                            schedule,
-                            current_date,
-                            start_time_str,
-                            end_time_str,
-                            override_existing
-                        )
-                        
-                        created_count += day_slots_result["created"]
-                        skipped_count += day_slots_result["skipped"]
+            # Проверяем, есть ли этот день в еженедельном расписании и является ли он рабочим
+            day_hours = weekly_hours[current_date.weekday()]
+            if day_hours is None:
+                continue
+            start_time_str, end_time_str = day_hours
             
-            # Переходим к следующему дню
-            current_date += timedelta(days=1)
+            # Проверяем наличие исключений для этой даты
+            exception = exceptions_by_date.get(current_date.isoformat())
+            if exception:
+                if not exception.get("is_working_day", True):
+                    # Если это исключение и день не рабочий, пропускаем
+                    continue
+                start_time_str = exception.get("start", start_time_str)
+                end_time_str = exception.get("end", end_time_str)
+            
+            if start_time_str and end_time_str:
+                # Создаем временные слоты для этого дня
+                self._create_day_slots(
+                    schedule,
+                    current_date,
+                    start_time_str,
+                    end_time_str,
+                    slots_to_insert
+                )
         
         # Добавляем слоты для повторяющихся событий
         if schedule.recurring_events:
-            events_result = await self._create_recurring_event_slots(
+            self._create_recurring_event_slots(
                 schedule,
                 start_date,
                 end_date,
-                override_existing
+                slots_to_insert
             )
-            
-            created_count += events_result["created"]
-            skipped_count += events_result["skipped"]
+        
+        created_count = await self._insert_slots(slots_to_insert)
+        skipped_count = len(slots_to_insert) - created_count
+        
+        # Удаление старых и вставка новых слотов фиксируются одной транзакцией
+        await self.db.commit()
         
         return {"created": created_count, "skipped": skipped_count}
     
     # Вспомогательные методы
     
-    def _get_weekday_name(self, weekday: int) -> str:
-        """Получить название дня недели по его номеру"""
-        weekday_names = [
-            "monday", "tuesday", "wednesday", "thursday", 
-            "friday", "saturday", "sunday"
-        ]
-        return weekday_names[weekday]
-    
-    def _find_exception_for_date(
-        self, 
-        schedule: Schedule, 
-        date: datetime
-    ) -> Optional[Dict[str, Any]]:
-        """Найти исключение для указанной даты в расписании"""
-        if not schedule.exceptions:
-            return None
-        
-        date_str = date.strftime("%Y-%m-%d")
-        
-        for exception in schedule.exceptions:
-            if exception.get("date") == date_str:
-                return exception
-        
-        return None
-    
     async def _delete_existing_slots(
         self, 
         schedule_id: int, 
@@ -279,95 +357,78 @@ class ScheduleService:
         end_date: datetime
     ) -> int:
         """Удалить существующие временные слоты в указанном диапазоне дат"""
-        # Подготовим запрос для удаления
-        query = select(TimeSlot).where(
+        # Полуоткрытый интервал [start_date, end_date + 1 день): граница не теряет
+        # слоты с долями секунды, а условие по start_time - обычный диапазон индекса
+        count = await self._delete_slots_where(
             and_(
                 TimeSlot.schedule_id == schedule_id,
                 TimeSlot.start_time >= start_date,
-                TimeSlot.start_time <= end_date.replace(hour=23, minute=59, second=59)
+                TimeSlot.start_time < end_date + timedelta(days=1)
             )
         )
+        return count
+    
+    async def _delete_slots_where(self, condition) -> int:
+        """
+        Удалить временные слоты по условию двумя запросами DELETE
         
-        result = await self.db.execute(query)
-        slots_to_delete = result.scalars().all()
-        count = len(slots_to_delete)
-        
-        for slot in slots_to_delete:
-            await self.db.delete(slot)
+        Бронирования слотов удаляются так же, как это делал каскад
+        TimeSlot.bookings при удалении слотов по одному через сессию.
+        Счетчик services.booking_count уменьшается триггером на bookings
+        в той же транзакции, отдельный UPDATE услуг не нужен.
         
-        await self.db.commit()
-        return count
+        Args:
+            condition: Условие отбора слотов
+            
+        Returns:
+            Количество удаленных слотов
+        """
+        slot_ids = select(TimeSlot.id).where(condition)
+        await self.db.execute(delete(Booking).where(Booking.time_slot_id.in_(slot_ids)))
+        result = await self.db.execute(delete(TimeSlot).where(condition))
+        return result.rowcount
     
-    async def _create_day_slots(
+    def _create_day_slots(
         self,
         schedule: Schedule,
-        day: datetime,
+        day: date,
         start_time_str: str,
         end_time_str: str,
-        check_existing: bool = True
-    ) -> Dict[str, int]:
-        """Создать временные слоты для одного дня"""
-        created_count = 0
-        skipped_count = 0
-        
-        # Парсим строки времени
-        start_hour, start_minute = map(int, start_time_str.split(":"))
-        end_hour, end_minute = map(int, end_time_str.split(":"))
-        
-        # Создаем datetime объекты для начала и конца рабочего дня
-        day_start = day.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-        day_end = day.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
-        
-        # Длительность и интервал слотов (в минутах)
-        slot_duration = schedule.slot_duration
-        slot_interval = schedule.slot_interval
-        
-        # Общая длительность слота с учетом интервала
-        total_slot_duration = slot_duration + slot_interval
-        
-        # Генерируем временные слоты
-        current_slot_start = day_start
-        while current_slot_start + timedelta(minutes=slot_duration) <= day_end:
-            # Конец текущего слота
-            current_slot_end = current_slot_start + timedelta(minutes=slot_duration)
-            
-            # Проверяем, существует ли уже слот с таким временем
-            if check_existing:
-                existing_slot = await self._check_slot_exists(
-                    schedule.id, 
-                    current_slot_start, 
-                    current_slot_end
-                )
-                
-                if existing_slot:
-                    skipped_count += 1
-                else:
-                    # Создаем новый слот
-                    await self._create_slot(schedule, current_slot_start, current_slot_end)
-                    created_count += 1
-            else:
-                # Создаем новый слот без проверки
-                await self._create_slot(schedule, current_slot_start, current_slot_end)
-                created_count += 1
-            
-            # Переходим к следующему слоту
-            current_slot_start += timedelta(minutes=total_slot_duration)
-        
-        return {"created": created_count, "skipped": skipped_count}
+        slots_to_insert: List[Dict[str, Any]]
+    ) -> None:
+        """Подготовить временные слоты для одного дня и добавить их строки в slots_to_insert"""
+        # Смещения слотов от полуночи общие для всех дней с такими же часами работы
+        offsets = _day_slot_offsets(
+            start_time_str, end_time_str, schedule.slot_duration, schedule.slot_interval
+        )
+        day_midnight = datetime.combine(day, time.min)
+        
+        # Строки дня собираются одним выражением без промежуточных вызовов на слот;
+        # общие для всех слотов поля берутся из расписания один раз
+        schedule_id = schedule.id
+        max_bookings = schedule.max_concurrent_bookings
+        slots_to_insert.extend(
+            {
+                "schedule_id": schedule_id,
+                "start_time": day_midnight + start_offset,
+                "end_time": day_midnight + end_offset,
+                "max_bookings": max_bookings,
+                "is_available": True,
+                "special_conditions": None
+            }
+            for start_offset, end_offset in offsets
+        )
     
-    async def _create_recurring_event_slots(
+    def _create_recurring_event_slots(
         self,
         schedule: Schedule,
         start_date: datetime,
         end_date: datetime,
-        check_existing: bool = True
-    ) -> Dict[str, int]:
-        """Создать временные слоты для повторяющихся событий"""
+        slots_to_insert: List[Dict[str, Any]]
+    ) -> None:
+        """Подготовить временные слоты для повторяющихся событий и добавить их строки в slots_to_insert"""
         if not schedule.recurring_events:
-            return {"created": 0, "skipped": 0}
-        
-        created_count = 0
-        skipped_count = 0
+            return
         
         # Проходим по каждому повторяющемуся событию
         for event in schedule.recurring_events:
@@ -383,133 +444,92 @@ class ScheduleService:
             if not event_start_time or not event_end_time:
                 continue
             
-            # Парсим строки времени
-            start_hour, start_minute = map(int, event_start_time.split(":"))
-            end_hour, end_minute = map(int, event_end_time.split(":"))
+            # Время начала и конца события собирается один раз на событие
+            event_start = time(*_parse_hour_minute(event_start_time))
+            event_end = time(*_parse_hour_minute(event_end_time))
             
             # Ограничиваем период события нашим диапазоном дат
-            event_period_start = start_date
-            event_period_end = end_date
+            event_period_start = start_date.date()
+            event_period_end = end_date.date()
             
             # Если указана начальная дата события и она позже нашей начальной даты
             if event_start_date:
-                event_start_date_obj = datetime.strptime(event_start_date, "%Y-%m-%d")
+                event_start_date_obj = date.fromisoformat(event_start_date)
                 if event_start_date_obj > event_period_start:
                     event_period_start = event_start_date_obj
             
             # Если указана конечная дата события и она раньше нашей конечной даты
             if event_end_date:
-                event_end_date_obj = datetime.strptime(event_end_date, "%Y-%m-%d")
+                event_end_date_obj = date.fromisoformat(event_end_date)
                 if event_end_date_obj < event_period_end:
                     event_period_end = event_end_date_obj
             
-            # Получаем числовые значения дней недели
-            weekday_numbers = []
+            # Дни недели события как битовая маска: бит N установлен для дня N
+            weekday_mask = 0
             for day_name in event_days:
-                weekday_numbers.append(self._get_weekday_number(day_name))
+                weekday_number = self._get_weekday_number(day_name)
+                if weekday_number >= 0:
+                    weekday_mask |= 1 << weekday_number
+            
+            special_conditions = {"event_name": event_name}
             
             # Проходим по каждому дню в нашем диапазоне
-            current_date = event_period_start
-            while current_date <= event_period_end:
-                # Если текущий день входит в список дней для события
-                if current_date.weekday() in weekday_numbers:
-                    # Создаем datetime объекты для начала и конца события
-                    event_slot_start = current_date.replace(
-                        hour=start_hour, 
-                        minute=start_minute, 
-                        second=0, 
-                        microsecond=0
-                    )
-                    event_slot_end = current_date.replace(
-                        hour=end_hour, 
-                        minute=end_minute, 
-                        second=0, 
-                        microsecond=0
-                    )
-                    
-                    # Проверяем, существует ли уже слот с таким временем
-                    if check_existing:
-                        existing_slot = await self._check_slot_exists(
-                            schedule.id, 
-                            event_slot_start, 
-                            event_slot_end
-                        )
-                        
-                        if existing_slot:
-                            skipped_count += 1
-                        else:
-                            # Создаем новый слот для события
-                            special_conditions = {"event_name": event_name}
-                            await self._create_slot(
-                                schedule, 
-                                event_slot_start, 
-                                event_slot_end,
-                                special_conditions
-                            )
-                            created_count += 1
-                    else:
-                        # Создаем новый слот без проверки
-                        special_conditions = {"event_name": event_name}
-                        await self._create_slot(
-                            schedule, 
-                            event_slot_start, 
-                            event_slot_end,
-                            special_conditions
-                        )
-                        created_count += 1
+            for day_ordinal in range(event_period_start.toordinal(), event_period_end.toordinal() + 1):
+                current_date = date.fromordinal(day_ordinal)
                 
-                # Переходим к следующему дню
-                current_date += timedelta(days=1)
-        
-        return {"created": created_count, "skipped": skipped_count}
+                # Если текущий день входит в список дней для события
+                if (weekday_mask >> current_date.weekday()) & 1:
+                    # Создаем новый слот для события
+                    slots_to_insert.append(self._create_slot(
+                        schedule, 
+                        datetime.combine(current_date, event_start), 
+                        datetime.combine(current_date, event_end),
+                        special_conditions
+                    ))
     
     def _get_weekday_number(self, weekday_name: str) -> int:
         """Получить номер дня недели по его названию"""
-        weekday_dict = {
-            "monday": 0,
-            "tuesday": 1,
-            "wednesday": 2,
-            "thursday": 3,
-            "friday": 4,
-            "saturday": 5,
-            "sunday": 6
-        }
-        return weekday_dict.get(weekday_name.lower(), -1)
+        return _WEEKDAY_NUMBERS.get(weekday_name.lower(), -1)
     
-    async def _check_slot_exists(
-        self, 
-        schedule_id: int, 
-        start_time: datetime, 
-        end_time: datetime
-    ) -> bool:
-        """Проверить, существует ли уже временной слот с указанным временем"""
-        query = select(TimeSlot).where(
-            and_(
-                TimeSlot.schedule_id == schedule_id,
-                TimeSlot.start_time == start_time,
-                TimeSlot.end_time == end_time
-            )
-        )
-        
-        result = await self.db.execute(query)
-        return result.scalars().first() is not None
-    
-    async def _create_slot(
+    def _create_slot(
         self, 
         schedule: Schedule, 
         start_time: datetime, 
         end_time: datetime,
         special_conditions: Optional[Dict[str, Any]] = None
-    ) -> TimeSlot:
-        """Создать новый временной слот"""
-        new_slot = TimeSlot(
-            schedule_id=schedule.id,
-            start_time=start_time,
-            end_time=end_time,
-            max_bookings=schedule.max_concurrent_bookings,
-            is_available=True,
-            special_conditions=special_conditions
+    ) -> Dict[str, Any]:
+        """Подготовить строку нового временного слота для пакетной вставки"""
+        return {
+            "schedule_id": schedule.id,
+            "start_time": start_time,
+            "end_time": end_time,
+            "max_bookings": schedule.max_concurrent_bookings,
+            "is_available": True,
+            "special_conditions": special_conditions
+        }
+    
+    async def _insert_slots(self, slots_to_insert: List[Dict[str, Any]]) -> int:
+        """
+        Вставить подготовленные слоты пакетами, пропуская уже существующие
+        
+        Каждый пакет отправляется одним INSERT с несколькими VALUES
+        (insertmanyvalues в SQLAlchemy 2.0) вместо отдельного INSERT на слот.
+        ON CONFLICT DO NOTHING по уникальному индексу отсеивает дубли атомарно,
+        в том числе при одновременной генерации из нескольких запросов.
+        
+        Returns:
+            Количество действительно созданных слотов
+        """
+        query = (
+            pg_insert(TimeSlot)
+            .on_conflict_do_nothing(index_elements=_TIME_SLOT_CONFLICT_COLUMNS)
+            .returning(TimeSlot.id)
         )
-        
-        self.db.add(new_slot)
-        return new_slot 
\ No newline at end of file
+        created_count = 0
+        for offset in range(0, len(slots_to_insert), TIME_SLOTS_INSERT_BATCH):
+            result = await self.db.execute(
+                query,
+                slots_to_insert[offset:offset + TIME_SLOTS_INSERT_BATCH]
+            )
+            created_count += len(result.all())
+        return created_count 
\ No newline at end of file
@@ -1,12 +1,173 @@
-import json
-from typing import Optional, Dict, Any, List
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Union
 
-import aiohttp
+import httpx
+import orjson
 from fastapi import BackgroundTasks
 
 from src.core.config import settings
 from src.core.errors import TelegramError
 from src.schemas.booking import BookingDetailResponse
+from src.schemas.telegram import TelegramUpdate
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_API_BASE_URL = "https://api.telegram.org"
+
+# Границы адаптивного размера пачки уведомлений, забираемых из очереди за один проход
+_NOTIFY_MIN_BATCH = 8
+_NOTIFY_MAX_BATCH = 256
+
+# Максимум одновременных запросов к Bot API из очереди уведомлений
+_NOTIFY_CONCURRENCY = 32
+
+# Сколько секунд при остановке ждать отправки уже поставленных уведомлений
+_NOTIFY_DRAIN_TIMEOUT = 5
+
+
+def _markup_template(reply_markup: Dict[str, Any]) -> str:
+    """
+    Сериализовать клавиатуру в JSON-шаблон для str.format
+    
+    Фигурные скобки JSON экранируются, а плейсхолдер {booking_id}
+    в callback_data остается доступным для подстановки.
+    """
+    return (
+        orjson.dumps(reply_markup).decode()
+        .replace("{", "{{")
+        .replace("}", "}}")
+        .replace("{{booking_id}}", "{booking_id}")
+    )
+
+
+# Тело запросов к Bot API сериализуется через orjson сразу в bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Ключевые слова запроса на поиск услуг в тексте сообщения
+_SEARCH_KEYWORDS = ("найти", "поиск")
+
+# Формат даты и времени бронирования в сообщениях
+_BOOKING_TIME_FORMAT = '%d.%m.%Y %H:%M'
+
+# Шаблоны текстов уведомлений о бронировании для str.format_map
+_BOOKING_NOTIFICATION_TEXT = (
+    "🔔 <b>Новое бронирование #{id}</b>\n\n"
+    "📅 Дата и время: <b>{booking_time}</b>\n"
+    "🏢 Компания: <b>{company}</b>\n"
+    "🔧 Услуга: <b>{service}</b>\n"
+    "💰 Стоимость: <b>{amount} ₽</b>\n"
+    "💳 Статус оплаты: <b>{payment_status}</b>\n\n"
+    "📝 Примечания: {notes}"
+)
+
+_BOOKING_CONFIRMATION_TEXT = (
+    "✅ <b>Бронирование #{id} подтверждено</b>\n\n"
+    "Ваше бронирование подтверждено. Мы будем ждать вас в указанное время!"
+)
+
+_BOOKING_CANCELLATION_TEXT = "❌ <b>Бронирование #{id} отменено</b>\n\n{reason}Вы можете создать новое бронирование в любое время."
+
+_BOOKING_CANCELLATION_REASON = "Причина: {reason}\n\n"
+
+_BOOKING_REMINDER_TEXT = (
+    "⏰ <b>Напоминание о бронировании #{id}</b>\n\n"
+    "Ваше бронирование запланировано на <b>{booking_time}</b>\n"
+    "Компания: <b>{company}</b>\n"
+    "Услуга: <b>{service}</b>"
+)
+
+def _search_category_text(category: str) -> str:
+    """Текст ответа на выбор категории поиска"""
+    return (
+        f"Вот что я нашел в категории <b>{category}</b>:\n\n"
+        "В данный момент это демо-версия, поэтому список ограничен. "
+        "В полной версии здесь будут результаты поиска."
+    )
+
+
+def _booking_details_text(booking_id: str) -> str:
+    """Текст ответа на запрос деталей бронирования"""
+    return (
+        f"Детали бронирования #{booking_id}:\n\n"
+        "В данный момент это демо-версия, поэтому детали не доступны. "
+        "В полной версии здесь будет информация о бронировании."
+    )
+
+
+# Обработчики inline-кнопок по префиксу callback_data (часть до первого ":")
+_CALLBACK_HANDLERS = {
+    "search_category": _search_category_text,
+    "booking_details": _booking_details_text,
+}
+
+
+@lru_cache(maxsize=1024)
+def _render_callback_text(callback_data: str) -> Optional[str]:
+    """
+    Сформировать текст ответа на нажатие inline-кнопки
+    
+    Текст зависит только от callback_data, поэтому повторные доставки
+    и двойные нажатия обслуживаются из кэша.
+    
+    Args:
+        callback_data: Данные кнопки
+        
+    Returns:
+        Текст ответа или None, если кнопка не обрабатывается
+    """
+    # Один проход по строке и один поиск в словаре вместо цепочки startswith + split
+    prefix, _, argument = callback_data.partition(":")
+    handler = _CALLBACK_HANDLERS.get(prefix)
+    if handler is None:
+        return None
+    return handler(argument)
+
+
+# Клавиатуры не меняются между вызовами, поэтому сериализуются в JSON один раз при импорте
+_START_KEYBOARD_JSON = orjson.dumps({
+    "keyboard": [
+        [{"text": "🔍 Найти услуги"}, {"text": "📅 Мои бронирования"}],
+        [{"text": "🏢 Популярные компании"}, {"text": "❓ Помощь"}]
+    ],
+    "resize_keyboard": True
+}).decode()
+
+_SEARCH_KEYBOARD_JSON = orjson.dumps({
+    "inline_keyboard": [
+        [
+            {"text": "💇‍♀️ Красота", "callback_data": "search_category:beauty"},
+            {"text": "🍽️ Рестораны", "callback_data": "search_category:restaurant"}
+        ],
+        [
+            {"text": "👨‍⚕️ Медицина", "callback_data": "search_category:medical"},
+            {"text": "🛠️ Ремонт", "callback_data": "search_category:repair"}
+        ]
+    ]
+}).decode()
+
+# Клавиатуры бронирования отличаются только ID: .format(booking_id=...)
+_BOOKING_ACTIONS_TEMPLATE = _markup_template({
+    "inline_keyboard": [
+        [
+            {"text": "✅ Подтвердить", "callback_data": "confirm_booking:{booking_id}"},
+            {"text": "❌ Отменить", "callback_data": "cancel_booking:{booking_id}"}
+        ],
+        [
+            {"text": "📋 Детали", "callback_data": "booking_details:{booking_id}"}
+        ]
+    ]
+})
+
+_BOOKING_REMINDER_TEMPLATE = _markup_template({
+    "inline_keyboard": [
+        [
+            {"text": "📋 Детали", "callback_data": "booking_details:{booking_id}"},
+            {"text": "❌ Отменить", "callback_data": "cancel_booking:{booking_id}"}
+        ]
+    ]
+})
 
 
 class TelegramService:
@@ -16,8 +177,106 @@ class TelegramService:
     
     def __init__(self):
         self.token = settings.TELEGRAM_BOT_TOKEN
-        self.api_url = f"https://api.telegram.org/bot{self.token}"
+        # Путь методов Bot API относительно TELEGRAM_API_BASE_URL
+        self.api_path = f"/bot{self.token}"
         self.webhook_url = settings.TELEGRAM_WEBHOOK_URL
+        # Один HTTP/2-клиент на весь срок жизни сервиса: параллельные запросы
+        # к Telegram API мультиплексируются в одном TCP+TLS соединении
+        self._client: Optional[httpx.AsyncClient] = None
+        # Очередь уведомлений и фоновый обработчик создаются при запуске приложения
+        self._notify_queue: Optional[asyncio.Queue] = None
+        self._notify_worker: Optional[asyncio.Task] = None
+        self._notify_semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Получить общий HTTP-клиент, создав его при первом обращении
+        
+        Клиент создается лениво, чтобы он был привязан к запущенному циклу событий.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                base_url=TELEGRAM_API_BASE_URL,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+        return self._client
+    
+    def start_notification_worker(self) -> None:
+        """
+        Запустить фоновый обработчик очереди уведомлений
+        
+        Вызывается при запуске приложения, когда цикл событий уже работает.
+        """
+        if self._notify_worker is not None and not self._notify_worker.done():
+            return
+        self._notify_queue = asyncio.Queue()
+        self._notify_semaphore = asyncio.Semaphore(_NOTIFY_CONCURRENCY)
+        self._notify_worker = asyncio.create_task(self._notification_worker())
+    
+    async def _notification_worker(self) -> None:
+        """
+        Отправлять уведомления из очереди пачками
+        
+        Все уведомления, накопившиеся к моменту выборки, отправляются параллельно
+        (не более _NOTIFY_CONCURRENCY запросов одновременно). Размер пачки растет,
+        пока очередь не успевает разгружаться, и уменьшается, когда она пустеет.
+        """
+        queue = self._notify_queue
+        batch_size = _NOTIFY_MIN_BATCH
+        while True:
+            items: List[Tuple[int, BookingDetailResponse]] = [await queue.get()]
+            # Отдаем управление, чтобы одновременные вызовы успели поставить свои уведомления
+            await asyncio.sleep(0)
+            while not queue.empty() and len(items) < batch_size:
+                items.append(queue.get_nowait())
+            
+            if queue.qsize() > len(items):
+                batch_size = min(batch_size * 2, _NOTIFY_MAX_BATCH)
+            elif queue.empty():
+                batch_size = max(batch_size // 2, _NOTIFY_MIN_BATCH)
+            
+            results = await asyncio.gather(
+                *(self._send_queued_notification(chat_id, booking) for chat_id, booking in items),
+                return_exceptions=True
+            )
+            for (chat_id, booking), result in zip(items, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Ошибка отправки уведомления о бронировании #{booking.id} в чат {chat_id}: {result}")
+                queue.task_done()
+    
+    async def _send_queued_notification(
+        self, 
+        chat_id: int, 
+        booking: BookingDetailResponse
+    ) -> Dict[str, Any]:
+        """
+        Отправить уведомление из очереди с ограничением числа одновременных запросов
+        """
+        async with self._notify_semaphore:
+            return await self.send_booking_notification(chat_id, booking)
+    
+    async def aclose(self) -> None:
+        """
+        Остановить обработчик уведомлений и закрыть общий HTTP-клиент при остановке приложения
+        """
+        if self._notify_worker is not None:
+            # Даем отправиться уже поставленным уведомлениям, затем останавливаем обработчик
+            try:
+                await asyncio.wait_for(self._notify_queue.join(), timeout=_NOTIFY_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Не отправлено уведомлений при остановке: {self._notify_queue.qsize()}")
+            self._notify_worker.cancel()
+            try:
+                await self._notify_worker
+            except asyncio.CancelledError:
+                pass
+            self._notify_worker = None
+            self._notify_queue = None
+        
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
     
     async def set_webhook(self) -> Dict[str, Any]:
         """
@@ -29,19 +288,20 @@ class TelegramService:
         if not self.webhook_url:
             raise TelegramError("Webhook URL not configured")
         
-        url = f"{self.api_url}/setWebhook"
+        url = f"{self.api_path}/setWebhook"
         payload = {
             "url": str(self.webhook_url),
-            "allowed_updates": ["message", "callback_query"]
+            "allowed_updates": ["message", "callback_query"],
+            "max_connections": settings.TELEGRAM_WEBHOOK_MAX_CONNECTIONS,
+            "drop_pending_updates": False
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise TelegramError(f"Failed to set webhook: {text}")
-                
-                return await response.json()
+        client = await self._get_client()
+        response = await client.post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+        if response.status_code != 200:
+            raise TelegramError(f"Failed to set webhook: {response.text}")
+        
+        return response.json()
     
     async def delete_webhook(self) -> Dict[str, Any]:
         """
@@ -50,30 +310,31 @@ class TelegramService:
         if not self.token:
             raise TelegramError("Telegram token not configured")
             
-        url = f"{self.api_url}/deleteWebhook"
+        url = f"{self.api_path}/deleteWebhook"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise TelegramError(f"Failed to delete webhook: {text}")
-                
-                return await response.json()
+        client = await self._get_client()
+        response = await client.get(url)
+        if response.status_code != 200:
+            raise TelegramError(f"Failed to delete webhook: {response.text}")
+        
+        return response.json()
     
     async def send_message(
         self, 
         chat_id: int, 
         text: str, 
         parse_mode: str = "HTML",
-        reply_markup: Optional[Dict[str, Any]] = None
+        reply_markup: Optional[Union[Dict[str, Any], str]] = None
     ) -> Dict[str, Any]:
         """
         Отправить сообщение пользователю
+        
+        reply_markup можно передать словарем или уже сериализованной JSON-строкой.
         """
         if not self.token:
             raise TelegramError("Telegram token not configured")
             
-        url = f"{self.api_url}/sendMessage"
+        url = f"{self.api_path}/sendMessage"
         payload = {
             "chat_id": chat_id,
             "text": text,
@@ -81,15 +342,17 @@ class TelegramService:
         }
         
         if reply_markup:
-            payload["reply_markup"] = json.dumps(reply_markup)
+            # Готовая JSON-строка передается без повторной сериализации
+            payload["reply_markup"] = (
+                reply_markup if isinstance(reply_markup, str) else orjson.dumps(reply_markup).decode()
+            )
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise TelegramError(f"Failed to send message: {text}")
-                
-                return await response.json()
+        client = await self._get_client()
+        response = await client.post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+        if response.status_code != 200:
+            raise TelegramError(f"Failed to send message: {response.text}")
+        
+        return response.json()
     
     def schedule_booking_notification(
         self, 
@@ -99,8 +362,14 @@ class TelegramService:
     ) -> None:
         """
         Запланировать отправку уведомления о бронировании
+        
+        Уведомление ставится в общую очередь, которую фоновый обработчик
+        отправляет пачками; если обработчик не запущен, используется BackgroundTasks.
         """
-        background_tasks.add_task(self.send_booking_notification, chat_id, booking)
+        if self._notify_worker is not None and not self._notify_worker.done():
+            self._notify_queue.put_nowait((chat_id, booking))
+        else:
+            background_tasks.add_task(self.send_booking_notification, chat_id, booking)
     
     async def send_booking_notification(
         self, 
@@ -110,37 +379,18 @@ class TelegramService:
         """
         Отправить уведомление о бронировании
         """
-        text = (
-            f"🔔 <b>Новое бронирование #{booking.id}</b>\n\n"
-            f"📅 Дата и время: <b>{booking.booking_time.strftime('%d.%m.%Y %H:%M')}</b>\n"
-            f"🏢 Компания: <b>{booking.company_name or 'Не указано'}</b>\n"
-            f"🔧 Услуга: <b>{booking.service_name or 'Не указано'}</b>\n"
-            f"💰 Стоимость: <b>{booking.amount or 0} ₽</b>\n"
-            f"💳 Статус оплаты: <b>{booking.payment_status}</b>\n\n"
-            f"📝 Примечания: {booking.customer_notes or 'Нет'}"
-        )
+        text = _BOOKING_NOTIFICATION_TEXT.format_map({
+            "id": booking.id,
+            "booking_time": booking.booking_time.strftime(_BOOKING_TIME_FORMAT),
+            "company": booking.company_name or 'Не указано',
+            "service": booking.service_name or 'Не указано',
+            "amount": booking.amount or 0,
+            "payment_status": booking.payment_status,
+            "notes": booking.customer_notes or 'Нет'
+        })
         
-        # Создаем кнопки для управления бронированием
-        reply_markup = {
-            "inline_keyboard": [
-                [
-                    {
-                        "text": "✅ Подтвердить",
-                        "callback_data": f"confirm_booking:{booking.id}"
-                    },
-                    {
-                        "text": "❌ Отменить",
-                        "callback_data": f"cancel_booking:{booking.id}"
-                    }
-                ],
-                [
-                    {
-                        "text": "📋 Детали",
-                        "callback_data": f"booking_details:{booking.id}"
-                    }
-                ]
-            ]
-        }
+        # Кнопки для управления бронированием
+        reply_markup = _BOOKING_ACTIONS_TEMPLATE.format(booking_id=booking.id)
         
         return await self.send_message(chat_id, text, reply_markup=reply_markup)
     
@@ -152,10 +402,7 @@ class TelegramService:
         """
         Отправить подтверждение бронирования
         """
-        text = (
-            f"✅ <b>Бронирование #{booking_id} подтверждено</b>\n\n"
-            f"Ваше бронирование подтверждено. Мы будем ждать вас в указанное время!"
-        )
+        text = _BOOKING_CONFIRMATION_TEXT.format_map({"id": booking_id})
         
         return await self.send_message(chat_id, text)
     
@@ -168,14 +415,10 @@ class TelegramService:
         """
         Отправить уведомление об отмене бронирования
         """
-        text = (
-            f"❌ <b>Бронирование #{booking_id} отменено</b>\n\n"
-        )
-        
-        if reason:
-            text += f"Причина: {reason}\n\n"
-            
-        text += "Вы можете создать новое бронирование в любое время."
+        text = _BOOKING_CANCELLATION_TEXT.format_map({
+            "id": booking_id,
+            "reason": _BOOKING_CANCELLATION_REASON.format_map({"reason": reason}) if reason else ""
+        })
         
         return await self.send_message(chat_id, text)
     
@@ -187,28 +430,15 @@ class TelegramService:
         """
         Отправить напоминание о бронировании
         """
-        text = (
-            f"⏰ <b>Напоминание о бронировании #{booking.id}</b>\n\n"
-            f"Ваше бронирование запланировано на <b>{booking.booking_time.strftime('%d.%m.%Y %H:%M')}</b>\n"
-            f"Компания: <b>{booking.company_name or 'Не указано'}</b>\n"
-            f"Услуга: <b>{booking.service_name or 'Не указано'}</b>"
-        )
+        text = _BOOKING_REMINDER_TEXT.format_map({
+            "id": booking.id,
+            "booking_time": booking.booking_time.strftime(_BOOKING_TIME_FORMAT),
+            "company": booking.company_name or 'Не указано',
+            "service": booking.service_name or 'Не указано'
+        })
         
         # Кнопка для просмотра деталей или отмены
-        reply_markup = {
-            "inline_keyboard": [
-                [
-                    {
-                        "text": "📋 Детали",
-                        "callback_data": f"booking_details:{booking.id}"
-                    },
-                    {
-                        "text": "❌ Отменить",
-                        "callback_data": f"cancel_booking:{booking.id}"
-                    }
-                ]
-            ]
-        }
+        reply_markup = _BOOKING_REMINDER_TEMPLATE.format(booking_id=booking.id)
         
         return await self.send_message(chat_id, text, reply_markup=reply_markup)
     
@@ -219,10 +449,20 @@ class TelegramService:
         В реальном проекте здесь была бы логика работы нейроассистента Карл,
         который бы анализировал запросы пользователей и помогал с бронированием услуг
         """
+        # Обновление разбирается один раз, дальше используется доступ к атрибутам;
+        # прочие типы обновлений (edited_message, channel_post и т.п.) сразу пропускаются
+        parsed = TelegramUpdate.model_validate(update)
+        message = parsed.message
+        callback_query = parsed.callback_query
+        if message is None and callback_query is None:
+            return None
+        
         # Проверяем наличие сообщения
-        if "message" in update and "text" in update["message"]:
-            chat_id = update["message"]["chat"]["id"]
-            text = update["message"]["text"]
+        if message is not None and message.text is not None:
+            chat_id = message.chat.id
+            text = message.text
+            # Нижний регистр вычисляется один раз для всех проверок ключевых слов
+            text_lower = text.lower()
             
             # Простая логика для демонстрации
             if text.startswith("/start"):
@@ -231,17 +471,11 @@ class TelegramService:
                     "👋 Привет! Я нейроассистент <b>Карл</b>.\n\n"
                     "Я помогу вам найти подходящие услуги и забронировать их. "
                     "Расскажите, что вы ищете, или воспользуйтесь командами ниже.",
-                    reply_markup={
-                        "keyboard": [
-                            [{"text": "🔍 Найти услуги"}, {"text": "📅 Мои бронирования"}],
-                            [{"text": "🏢 Популярные компании"}, {"text": "❓ Помощь"}]
-                        ],
-                        "resize_keyboard": True
-                    }
+                    reply_markup=_START_KEYBOARD_JSON
                 )
             
             # Пример распознавания простой команды для поиска
-            elif "найти" in text.lower() or "поиск" in text.lower():
+            elif any(keyword in text_lower for keyword in _SEARCH_KEYWORDS):
                 return await self.send_message(
                     chat_id,
                     "🔍 <b>Что вы хотите найти?</b>\n\n"
@@ -250,18 +484,7 @@ class TelegramService:
                     "- Стрижка недорого\n"
                     "- Маникюр завтра утром\n\n"
                     "Или выберите категорию:",
-                    reply_markup={
-                        "inline_keyboard": [
-                            [
-                                {"text": "💇‍♀️ Красота", "callback_data": "search_category:beauty"},
-                                {"text": "🍽️ Рестораны", "callback_data": "search_category:restaurant"}
-                            ],
-                            [
-                                {"text": "👨‍⚕️ Медицина", "callback_data": "search_category:medical"},
-                                {"text": "🛠️ Ремонт", "callback_data": "search_category:repair"}
-                            ]
-                        ]
-                    }
+                    reply_markup=_SEARCH_KEYBOARD_JSON
                 )
                 
             # В реальном проекте здесь был бы обработчик естественного языка,
@@ -275,28 +498,24 @@ class TelegramService:
                 )
                 
         # Обработка коллбеков от inline-кнопок
-        elif "callback_query" in update:
-            callback_id = update["callback_query"]["id"]
-            chat_id = update["callback_query"]["message"]["chat"]["id"]
-            callback_data = update["callback_query"]["data"]
+        elif callback_query is not None and callback_query.message is not None and callback_query.data:
+            chat_id = callback_query.message.chat.id
             
             # Простая обработка для демонстрации
-            if callback_data.startswith("search_category:"):
-                category = callback_data.split(":")[1]
-                return await self.send_message(
-                    chat_id,
-                    f"Вот что я нашел в категории <b>{category}</b>:\n\n"
-                    "В данный момент это демо-версия, поэтому список ограничен. "
-                    "В полной версии здесь будут результаты поиска."
-                )
-            
-            elif callback_data.startswith("booking_details:"):
-                booking_id = callback_data.split(":")[1]
-                return await self.send_message(
-                    chat_id,
-                    f"Детали бронирования #{booking_id}:\n\n"
-                    "В данный момент это демо-версия, поэтому детали не доступны. "
-                    "В полной версии здесь будет информация о бронировании."
-                )
+            callback_text = _render_callback_text(callback_query.data)
+            if callback_text is not None:
+                return await self.send_message(chat_id, callback_text)
                 
-        return None 
\ No newline at end of file
+        return None
+
+
+# Общий экземпляр сервиса для всего приложения, чтобы все запросы
+# использовали одно соединение к Telegram API
+telegram_service = TelegramService()
+
+
+def get_telegram_service() -> TelegramService:
+    """
+    Зависимость FastAPI, возвращающая общий экземпляр TelegramService
+    """
+    return telegram_service
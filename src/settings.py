@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -47,4 +48,17 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings() 
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Получить настройки приложения
+    
+    Настройки (включая разбор .env) создаются один раз за процесс;
+    функцию можно использовать как зависимость FastAPI.
+    """
+    return Settings()
+
+
+# Глобальный экземпляр настроек для импорта в других модулях
+settings = get_settings()
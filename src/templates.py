@@ -1,5 +1,12 @@
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 from src.core.config import settings
 
-# Создаем экземпляр Jinja2Templates для использования в приложении
-templates = Jinja2Templates(directory=settings.TEMPLATES_DIR) 
\ No newline at end of file
+# Создаем экземпляр Jinja2Templates для использования в приложении.
+# Скомпилированный байткод шаблонов кэшируется на диске, а проверка
+# изменения исходников включена только в режиме отладки
+templates = Jinja2Templates(
+    directory=settings.TEMPLATES_DIR,
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=settings.DEBUG,
+)
@@ -13,6 +13,9 @@ from src.adapters.filestorage.session import s3_session_factory
 from src.adapters.telegram import TelegramGateway, TelegramGatewayProtocol
 from src.utils.unit_of_work import UnitOfWorkProtocol
 
+# Шлюз Telegram не хранит состояния запроса, поэтому один экземпляр общий для всех UnitOfWork
+_telegram_gateway = TelegramGateway()
+
 
 class UnitOfWork(UnitOfWorkProtocol):
     file_storage: FileStorageProtocol
@@ -29,16 +32,28 @@ class UnitOfWork(UnitOfWorkProtocol):
 
         self.file_storage = FileStorageRepository(self.s3_session)
         self.repositories = RepositoriesGateway(self.db_session)
-        self.telegram = TelegramGateway()
+        self.telegram = _telegram_gateway
+        self._committed = False
 
         return self
 
-    async def __aexit__(self, *args):
-        await self.rollback()
-        await shield(self.db_session.close())
+    async def __aexit__(self, exc_type, exc, tb):
+        # Откат и закрытие выполняются одним шагом под одной защитой от отмены,
+        # чтобы отмена запроса посреди выхода не оставила сессию незакрытой
+        await shield(self._cleanup(rollback=exc_type is not None and not self._committed))
+
+    async def _cleanup(self, rollback: bool):
+        # После успешного выхода явный ROLLBACK не нужен: close() сам
+        # завершает незафиксированную транзакцию при возврате соединения в пул
+        try:
+            if rollback:
+                await self.rollback()
+        finally:
+            await self.db_session.close()
 
     async def commit(self):
         await self.db_session.commit()
+        self._committed = True
 
     async def rollback(self):
         await self.db_session.rollback() 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Вспомогательные функции для работы с текущим временем
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import Request
+
+
+def utc_now() -> datetime:
+    """Возвращает текущее время в UTC с указанием часового пояса"""
+    return datetime.now(timezone.utc)
+
+
+def request_now(request: Request) -> datetime:
+    """
+    Возвращает время начала обработки запроса в UTC
+    
+    Значение вычисляется один раз и сохраняется в request.state, поэтому все
+    операции в рамках одного запроса получают одинаковую отметку времени.
+    
+    Args:
+        request: Текущий запрос
+        
+    Returns:
+        Время в UTC с указанием часового пояса
+    """
+    return request.state.__dict__.setdefault("_now", utc_now())
+
+
+def to_db_datetime(value: Optional[datetime] = None) -> datetime:
+    """
+    Приводит время к наивному UTC для колонок DateTime без часового пояса
+    
+    Args:
+        value: Время (по умолчанию текущее)
+        
+    Returns:
+        Наивное время в UTC
+    """
+    value = value or utc_now()
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
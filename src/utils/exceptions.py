@@ -1,53 +1,53 @@
 class BaseAppException(Exception):
     """Базовое исключение приложения"""
-    pass
+    __slots__ = ()
 
 
 class ResultNotFound(BaseAppException):
     """Результат не найден в базе данных"""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(BaseAppException):
     """Ошибка аутентификации"""
-    pass
+    __slots__ = ()
 
 
 class AuthorizationError(BaseAppException):
     """Ошибка авторизации"""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(BaseAppException):
     """Ошибка валидации данных"""
-    pass
+    __slots__ = ()
 
 
 class UserAlreadyExists(BaseAppException):
     """Пользователь уже существует"""
-    pass
+    __slots__ = ()
 
 
 class InvalidCredentials(BaseAppException):
     """Неверные учетные данные"""
-    pass
+    __slots__ = ()
 
 
 class TokenError(BaseAppException):
     """Ошибка с токеном"""
-    pass
+    __slots__ = ()
 
 
 class PermissionDenied(BaseAppException):
     """Доступ запрещен"""
-    pass
+    __slots__ = ()
 
 
 class FileStorageError(BaseAppException):
     """Ошибка при работе с файловым хранилищем"""
-    pass
+    __slots__ = ()
 
 
 class TelegramError(BaseAppException):
     """Ошибка при работе с Telegram API"""
-    pass 
\ No newline at end of file
+    __slots__ = () 
\ No newline at end of file
@@ -2,12 +2,15 @@
 Модуль для проверки прав доступа пользователей в приложении
 """
 
-from fastapi import HTTPException, status, Depends
+from typing import Optional
+
+from fastapi import HTTPException, Request, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db_adapter import get_db
 from src.services.auth_service import get_current_user
 from src.models.user import UserRole
+from src.repositories.company import CompanyRepository
 from src.schemas.user import UserResponse
 
 
@@ -72,7 +75,6 @@ async def is_company_owner(
         return current_user
     
     # Проверяем, является ли пользователь владельцем
-    from src.repositories.company import CompanyRepository
     company_repo = CompanyRepository(db)
     company = await company_repo.get_by_id(company_id)
     
@@ -116,7 +118,6 @@ async def can_manage_company(
         return current_user
     
     # Проверяем, является ли пользователь владельцем или менеджером
-    from src.repositories.company import CompanyRepository
     company_repo = CompanyRepository(db)
     company = await company_repo.get_by_id(company_id)
     
@@ -137,7 +138,42 @@ async def can_manage_company(
     )
 
 
-async def check_company_permission(db: AsyncSession, current_user: UserResponse, company_id: int) -> bool:
+async def get_request_company(request: Request, db: AsyncSession, company_id: int, eager: bool = False):
+    """
+    Получает компанию с кэшированием в рамках одного запроса
+    
+    Компания сохраняется в request.state.company_cache, поэтому проверка прав
+    и обработчик маршрута используют один и тот же объект без повторного SELECT.
+    
+    Args:
+        request: Текущий запрос
+        db: Сессия базы данных
+        company_id: ID компании
+        eager: Загрузить филиалы и рабочие часы вместе с компанией
+        
+    Returns:
+        Объект компании или None
+    """
+    cache = getattr(request.state, "company_cache", None)
+    if cache is None:
+        cache = request.state.company_cache = {}
+    
+    # Компания без связей в кэше не подходит, если нужна жадная загрузка
+    key = (company_id, eager)
+    if key not in cache:
+        if not eager and (company_id, True) in cache:
+            return cache[(company_id, True)]
+        cache[key] = await CompanyRepository(db).get_by_id(company_id, eager=eager)
+    
+    return cache[key]
+
+
+async def check_company_permission(
+    db: AsyncSession,
+    current_user: UserResponse,
+    company_id: int,
+    request: Optional[Request] = None
+) -> bool:
     """
     Проверяет права доступа пользователя к компании
     
@@ -145,6 +181,8 @@ async def check_company_permission(db: AsyncSession, current_user: UserResponse,
         db: Сессия базы данных
         current_user: Текущий пользователь
         company_id: ID компании
+        request: Текущий запрос; если передан, загруженная компания
+            кэшируется в request.state и переиспользуется маршрутом
         
     Returns:
         True, если пользователь имеет доступ к компании
@@ -157,9 +195,11 @@ async def check_company_permission(db: AsyncSession, current_user: UserResponse,
         return True
     
     # Проверяем, является ли пользователь владельцем или менеджером
-    from src.repositories.company import CompanyRepository
-    company_repo = CompanyRepository(db)
-    company = await company_repo.get_by_id(company_id)
+    if request is not None:
+        company = await get_request_company(request, db, company_id)
+    else:
+        company_repo = CompanyRepository(db)
+        company = await company_repo.get_by_id(company_id)
     
     if not company:
         raise HTTPException(
@@ -175,4 +215,32 @@ async def check_company_permission(db: AsyncSession, current_user: UserResponse,
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
         detail="Доступ запрещен: у вас нет прав на доступ к этой компании"
-    ) 
\ No newline at end of file
+    )
+
+
+async def require_company_permission(
+    company_id: int,
+    request: Request,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> UserResponse:
+    """
+    Зависимость FastAPI для проверки прав доступа к компании
+    
+    Использует те же зависимости get_current_user и get_db, что и обработчик,
+    поэтому FastAPI переиспользует пользователя и сессию в рамках запроса.
+    
+    Args:
+        company_id: ID компании из пути запроса
+        request: Текущий запрос
+        current_user: Текущий пользователь
+        db: Сессия базы данных
+        
+    Returns:
+        Объект пользователя, если проверка пройдена
+        
+    Raises:
+        HTTPException: Если пользователь не имеет доступа к компании
+    """
+    await check_company_permission(db, current_user, company_id, request=request)
+    return current_user
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+import asyncio
+import time
+from datetime import timedelta
 from typing import Dict, Optional, Union
 
 import jwt
@@ -9,6 +11,12 @@ from src.settings import settings
 # Настройка контекста для хеширования паролей
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Параметры JWT извлекаются из настроек один раз при импорте, а не на каждый токен
+_JWT_KEY = settings.JWT_SECRET_KEY.get_secret_value().encode()
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGS = [_JWT_ALGORITHM]
+_JWT_TOKEN_TTL = timedelta(minutes=settings.JWT_TOKEN_LIFETIME)
+
 
 def hash_password(password: str) -> str:
     """Хеширование пароля"""
@@ -24,34 +32,39 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# bcrypt занимает сотни миллисекунд CPU, поэтому в асинхронном коде хеширование
+# выполняется в пуле потоков и не блокирует цикл событий
+
+async def ahash_password(password: str) -> str:
+    """Хеширование пароля в пуле потоков"""
+    return await asyncio.get_running_loop().run_in_executor(None, pwd_context.hash, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Проверка пароля в пуле потоков"""
+    return await asyncio.get_running_loop().run_in_executor(
+        None, pwd_context.verify, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     data: Dict[str, Union[str, int]], expires_delta: Optional[timedelta] = None
 ) -> str:
     """Создание JWT токена доступа"""
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_TOKEN_LIFETIME)
+    # Срок действия - целое число секунд Unix, как и в закодированном токене
+    expire = int(time.time() + (expires_delta or _JWT_TOKEN_TTL).total_seconds())
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.JWT_SECRET_KEY.get_secret_value(), 
-        algorithm=settings.JWT_ALGORITHM
-    )
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 
 def decode_token(token: str) -> Dict[str, Union[str, int]]:
     """Декодирование JWT токена"""
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY.get_secret_value(),
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGS)
         return payload
     except jwt.PyJWTError:
         raise ValueError("Invalid token") 
\ No newline at end of file